@@ -40,7 +40,6 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
         sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
     )
-    op.create_index('ix_users_email', 'users', ['email'])
     op.create_index('ix_users_role', 'users', ['role'])
 
     # Create participants table
@@ -91,9 +90,8 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['competition_id'], ['competitions.id'], ondelete='CASCADE'),
         sa.UniqueConstraint('participant_id', 'competition_id', name='uq_participant_competition'),
     )
-    op.create_index('ix_registrations_participant_id', 'registrations', ['participant_id'])
-    op.create_index('ix_registrations_competition_id', 'registrations', ['competition_id'])
     op.create_index('ix_registrations_status', 'registrations', ['status'])
+    # participant_id/competition_id lookups use the leading column of these
     op.create_index('ix_registrations_participant_status', 'registrations', ['participant_id', 'status'])
     op.create_index('ix_registrations_competition_status', 'registrations', ['competition_id', 'status'])
 
@@ -108,9 +106,12 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['registration_id'], ['registrations.id'], ondelete='CASCADE'),
         sa.UniqueConstraint('registration_id'),
     )
-    op.create_index('ix_entry_tokens_token_hash', 'entry_tokens', ['token_hash'])
     op.create_index('ix_entry_tokens_registration_id', 'entry_tokens', ['registration_id'])
-    op.create_index('ix_entry_tokens_expires_at', 'entry_tokens', ['expires_at'])
+    # Only unused tokens are ever looked up by expiry
+    op.create_index(
+        'ix_entry_tokens_expires_at_unused', 'entry_tokens', ['expires_at'],
+        postgresql_where=sa.text('used_at IS NULL'),
+    )
 
     # Create attempts table
     op.create_table('attempts',
@@ -126,10 +127,13 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
         sa.ForeignKeyConstraint(['registration_id'], ['registrations.id'], ondelete='CASCADE'),
     )
-    op.create_index('ix_attempts_registration_id', 'attempts', ['registration_id'])
-    op.create_index('ix_attempts_sheet_token_hash', 'attempts', ['sheet_token_hash'])
     op.create_index('ix_attempts_status', 'attempts', ['status'])
-    op.create_index('ix_attempts_registration_status', 'attempts', ['registration_id', 'status'])
+    # Also serves registration_id lookups (leading column); INCLUDE lets the
+    # results listing run as an index-only scan
+    op.create_index(
+        'ix_attempts_registration_status', 'attempts', ['registration_id', 'status'],
+        postgresql_include=['score_total', 'confidence'],
+    )
 
     # Create scans table
     op.create_table('scans',
@@ -164,11 +168,12 @@ def upgrade() -> None:
         sa.Column('timestamp', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
     )
-    op.create_index('ix_audit_logs_entity_type', 'audit_logs', ['entity_type'])
-    op.create_index('ix_audit_logs_entity_id', 'audit_logs', ['entity_id'])
-    op.create_index('ix_audit_logs_action', 'audit_logs', ['action'])
-    op.create_index('ix_audit_logs_user_id', 'audit_logs', ['user_id'])
+    # Stays a btree: the admin audit log pages with ORDER BY timestamp DESC
+    # LIMIT n, which a BRIN index cannot return in order
     op.create_index('ix_audit_logs_timestamp', 'audit_logs', ['timestamp'], postgresql_ops={'timestamp': 'DESC'})
+    # Write-heavy table: besides the timestamp btree, only composites, whose
+    # leading columns also serve single-column lookups (entity_id is always
+    # queried with entity_type)
     op.create_index('ix_audit_logs_entity', 'audit_logs', ['entity_type', 'entity_id'])
     op.create_index('ix_audit_logs_user_timestamp', 'audit_logs', ['user_id', 'timestamp'])
     op.create_index('ix_audit_logs_action_timestamp', 'audit_logs', ['action', 'timestamp'])
@@ -25,27 +25,30 @@ def upgrade() -> None:
         sa.Column('city', sa.String(255), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
     )
-    op.create_index('ix_institutions_name', 'institutions', ['name'])
 
     # Add columns to participants
     op.add_column('participants', sa.Column('institution_id', postgresql.UUID(as_uuid=True), nullable=True))
     op.add_column('participants', sa.Column('dob', sa.Date(), nullable=True))
-    op.create_foreign_key(
-        'fk_participants_institution_id',
-        'participants', 'institutions',
-        ['institution_id'], ['id'],
-        ondelete='SET NULL'
-    )
-    op.create_index('ix_participants_institution_id', 'participants', ['institution_id'])
 
-    # Data migration: insert distinct school values into institutions
+    # Data migration: insert distinct school values into institutions.
+    # Deduplicate into a temp table first: DISTINCT over (gen_random_uuid(), school)
+    # never collapses rows, so every participant row used to hit the unique index.
     op.execute("""
-        INSERT INTO institutions (id, name, created_at)
-        SELECT DISTINCT gen_random_uuid(), school, now()
+        CREATE TEMP TABLE _new_inst AS
+        SELECT DISTINCT school AS name
         FROM participants
         WHERE school IS NOT NULL AND school != ''
-        ON CONFLICT (name) DO NOTHING
     """)
+    op.execute("""
+        INSERT INTO institutions (id, name, created_at)
+        SELECT gen_random_uuid(), n.name, now()
+        FROM _new_inst n
+        WHERE NOT EXISTS (SELECT 1 FROM institutions i WHERE i.name = n.name)
+    """)
+    op.execute("DROP TABLE _new_inst")
+    # Fresh statistics let the planner hash-join institutions instead of
+    # assuming the just-created table is empty
+    op.execute("ANALYZE institutions")
 
     # Update participants.institution_id from matching school names
     op.execute("""
@@ -54,6 +57,19 @@ def upgrade() -> None:
         FROM institutions i
         WHERE p.school = i.name
     """)
+    # Built after the UPDATE so the backfill does not maintain it row by row
+    op.create_index('ix_participants_institution_id', 'participants', ['institution_id'])
+
+    # Added after the UPDATE so the backfill fires no per-row FK triggers.
+    # NOT VALID skips the full-table check under ACCESS EXCLUSIVE lock;
+    # VALIDATE only takes SHARE UPDATE EXCLUSIVE, so reads and writes continue
+    op.execute("""
+        ALTER TABLE participants
+        ADD CONSTRAINT fk_participants_institution_id
+        FOREIGN KEY (institution_id) REFERENCES institutions (id)
+        ON DELETE SET NULL NOT VALID
+    """)
+    op.execute("ALTER TABLE participants VALIDATE CONSTRAINT fk_participants_institution_id")
 
     # Make school column nullable for forward compat
     op.alter_column('participants', 'school', nullable=True)
@@ -65,5 +81,4 @@ def downgrade() -> None:
     op.drop_constraint('fk_participants_institution_id', 'participants', type_='foreignkey')
     op.drop_column('participants', 'dob')
     op.drop_column('participants', 'institution_id')
-    op.drop_index('ix_institutions_name', 'institutions')
     op.drop_table('institutions')
@@ -48,28 +48,21 @@ def upgrade() -> None:
     op.create_index('ix_participant_events_attempt_id', 'participant_events', ['attempt_id'])
     op.create_index('ix_participant_events_recorded_by', 'participant_events', ['recorded_by'])
 
-    # Create answer_sheets table
+    # Create answer_sheets table. Indexes and the unique constraint are
+    # added after the backfill so the bulk insert does not maintain them
+    # row by row.
     op.create_table('answer_sheets',
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
         sa.Column('attempt_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('sheet_token_hash', sa.String(64), nullable=False, unique=True),
+        sa.Column('sheet_token_hash', sa.String(64), nullable=False),
         sa.Column('kind', sheet_kind_enum, nullable=False),
         sa.Column('pdf_file_path', sa.String(500), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
         sa.ForeignKeyConstraint(['attempt_id'], ['attempts.id'], ondelete='CASCADE'),
     )
-    op.create_index('ix_answer_sheets_attempt_id', 'answer_sheets', ['attempt_id'])
-    op.create_index('ix_answer_sheets_sheet_token_hash', 'answer_sheets', ['sheet_token_hash'])
 
     # Add answer_sheet_id to scans
     op.add_column('scans', sa.Column('answer_sheet_id', postgresql.UUID(as_uuid=True), nullable=True))
-    op.create_foreign_key(
-        'fk_scans_answer_sheet_id',
-        'scans', 'answer_sheets',
-        ['answer_sheet_id'], ['id'],
-        ondelete='SET NULL'
-    )
-    op.create_index('ix_scans_answer_sheet_id', 'scans', ['answer_sheet_id'])
 
     # Data migration: create answer_sheets from existing attempts
     op.execute("""
@@ -78,23 +71,35 @@ def upgrade() -> None:
         FROM attempts
         WHERE sheet_token_hash IS NOT NULL
     """)
+    op.create_unique_constraint('answer_sheets_sheet_token_hash_key', 'answer_sheets', ['sheet_token_hash'])
+    op.create_index('ix_answer_sheets_attempt_id', 'answer_sheets', ['attempt_id'])
 
     # Link existing scans to their answer_sheets
     op.execute("""
         UPDATE scans s
         SET answer_sheet_id = a_s.id
         FROM answer_sheets a_s
-        JOIN attempts att ON a_s.attempt_id = att.id
-        WHERE s.attempt_id = att.id AND a_s.kind = 'primary'
+        WHERE a_s.attempt_id = s.attempt_id AND a_s.kind = 'primary'
     """)
 
+    # Added after the UPDATE so the relink fires no per-row FK triggers.
+    # NOT VALID skips the full-table check under ACCESS EXCLUSIVE lock;
+    # VALIDATE only takes SHARE UPDATE EXCLUSIVE, so reads and writes continue
+    op.execute("""
+        ALTER TABLE scans
+        ADD CONSTRAINT fk_scans_answer_sheet_id
+        FOREIGN KEY (answer_sheet_id) REFERENCES answer_sheets (id)
+        ON DELETE SET NULL NOT VALID
+    """)
+    op.execute("ALTER TABLE scans VALIDATE CONSTRAINT fk_scans_answer_sheet_id")
+    op.create_index('ix_scans_answer_sheet_id', 'scans', ['answer_sheet_id'])
+
 
 def downgrade() -> None:
     op.drop_index('ix_scans_answer_sheet_id', 'scans')
     op.drop_constraint('fk_scans_answer_sheet_id', 'scans', type_='foreignkey')
     op.drop_column('scans', 'answer_sheet_id')
 
-    op.drop_index('ix_answer_sheets_sheet_token_hash', 'answer_sheets')
     op.drop_index('ix_answer_sheets_attempt_id', 'answer_sheets')
     op.drop_table('answer_sheets')
 
@@ -0,0 +1,57 @@
+"""Drop plain indexes duplicating UNIQUE indexes.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-02-21 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column) - each column is already covered by a unique index
+REDUNDANT_INDEXES = [
+    ('ix_users_email', 'users', 'email'),
+    ('ix_entry_tokens_token_hash', 'entry_tokens', 'token_hash'),
+    ('ix_attempts_sheet_token_hash', 'attempts', 'sheet_token_hash'),
+    ('ix_attempts_sheet_token', 'attempts', 'sheet_token_hash'),
+    ('ix_answer_sheets_sheet_token_hash', 'answer_sheets', 'sheet_token_hash'),
+    ('ix_institutions_name', 'institutions', 'name'),
+]
+
+
+def _plain_indexes() -> list[str]:
+    """Return names from REDUNDANT_INDEXES that exist and are not unique.
+
+    Revision 2126be9ffb45 replaced some UNIQUE constraints with unique
+    ix_* indexes of the same name; those enforce uniqueness and must stay.
+    """
+    rows = op.get_bind().execute(
+        sa.text(
+            "SELECT c.relname FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = ANY(:names) AND NOT i.indisunique"
+        ),
+        {"names": [name for name, _, _ in REDUNDANT_INDEXES]},
+    )
+    return [row[0] for row in rows]
+
+
+def upgrade() -> None:
+    names = _plain_indexes()
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name in names:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in REDUNDANT_INDEXES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column})')
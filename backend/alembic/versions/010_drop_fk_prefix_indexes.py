@@ -0,0 +1,35 @@
+"""Drop single-column FK indexes covered by composite indexes.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-02-21 10:05:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column) - column is the leading key of a composite index
+PREFIX_INDEXES = [
+    ('ix_registrations_participant_id', 'registrations', 'participant_id'),
+    ('ix_registrations_competition_id', 'registrations', 'competition_id'),
+    ('ix_attempts_registration_id', 'attempts', 'registration_id'),
+]
+
+
+def upgrade() -> None:
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, _, _ in PREFIX_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in PREFIX_INDEXES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column})')
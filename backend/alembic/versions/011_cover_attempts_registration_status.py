@@ -0,0 +1,38 @@
+"""Add score_total/confidence as INCLUDE columns of ix_attempts_registration_status.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-02-21 10:10:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def _swap(columns_sql: str) -> None:
+    """Rebuild ix_attempts_registration_status without blocking writes."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_attempts_registration_status_new')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_attempts_registration_status_new '
+            f'ON attempts {columns_sql}'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_attempts_registration_status')
+    op.execute(
+        'ALTER INDEX ix_attempts_registration_status_new '
+        'RENAME TO ix_attempts_registration_status'
+    )
+
+
+def upgrade() -> None:
+    _swap('(registration_id, status) INCLUDE (score_total, confidence)')
+
+
+def downgrade() -> None:
+    _swap('(registration_id, status)')
@@ -0,0 +1,33 @@
+"""Replace ix_entry_tokens_expires_at with a partial index on unused tokens.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-02-21 10:15:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_entry_tokens_expires_at_unused '
+            'ON entry_tokens (expires_at) WHERE used_at IS NULL'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_entry_tokens_expires_at')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_entry_tokens_expires_at '
+            'ON entry_tokens (expires_at)'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_entry_tokens_expires_at_unused')
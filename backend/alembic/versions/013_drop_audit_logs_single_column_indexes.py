@@ -0,0 +1,37 @@
+"""Drop audit_logs single-column indexes covered by composite indexes.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-02-21 10:20:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+# (index, column) - covered by the (entity_type, entity_id),
+# (action, timestamp) and (user_id, timestamp) composites
+SINGLE_COLUMN_INDEXES = [
+    ('ix_audit_logs_entity_type', 'entity_type'),
+    ('ix_audit_logs_entity_id', 'entity_id'),
+    ('ix_audit_logs_action', 'action'),
+    ('ix_audit_logs_user_id', 'user_id'),
+]
+
+
+def upgrade() -> None:
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, _ in SINGLE_COLUMN_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in SINGLE_COLUMN_INDEXES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON audit_logs ({column})')
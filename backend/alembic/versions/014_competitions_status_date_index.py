@@ -0,0 +1,33 @@
+"""Replace ix_competitions_status with a (status, date) composite.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-02-21 10:25:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Competition lists filter by status and order by date DESC; a
+        # backward scan of (status, date) returns the page already sorted
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_competitions_status_date '
+            'ON competitions (status, date)'
+        )
+        # status is the leading column of the composite
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_competitions_status')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_competitions_status ON competitions (status)')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_competitions_status_date')
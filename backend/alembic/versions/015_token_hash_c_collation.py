@@ -0,0 +1,40 @@
+"""Compare token hash columns byte-wise with the "C" collation.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-02-21 10:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) - hex HMAC digests looked up by equality on every scan
+TOKEN_HASH_COLUMNS = [
+    ('entry_tokens', 'token_hash'),
+    ('attempts', 'sheet_token_hash'),
+    ('answer_sheets', 'sheet_token_hash'),
+]
+
+
+def _set_collation(collation: str) -> None:
+    # Rebuilds each column's unique index under ACCESS EXCLUSIVE; the
+    # tables hold one row per registration/sheet, so this is brief
+    for table, column in TOKEN_HASH_COLUMNS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE varchar(64) COLLATE "{collation}"'
+        )
+
+
+def upgrade() -> None:
+    _set_collation('C')
+
+
+def downgrade() -> None:
+    _set_collation('default')
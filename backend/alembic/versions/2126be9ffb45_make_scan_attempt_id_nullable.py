@@ -49,7 +49,7 @@ def upgrade() -> None:
     op.drop_index(op.f('ix_audit_log_user_timestamp'), table_name='audit_log')
     op.drop_table('audit_log')
     op.drop_constraint(op.f('attempts_sheet_token_hash_key'), 'attempts', type_='unique')
-    op.drop_index(op.f('ix_attempts_sheet_token_hash'), table_name='attempts')
+    op.drop_index(op.f('ix_attempts_sheet_token_hash'), table_name='attempts', if_exists=True)
     op.create_index(op.f('ix_attempts_sheet_token_hash'), 'attempts', ['sheet_token_hash'], unique=True)
     op.create_index(op.f('ix_attempts_id'), 'attempts', ['id'], unique=False)
     op.create_index('ix_attempts_sheet_token', 'attempts', ['sheet_token_hash'], unique=False)
@@ -65,7 +65,7 @@ def upgrade() -> None:
     op.drop_constraint(op.f('entry_tokens_token_hash_key'), 'entry_tokens', type_='unique')
     op.drop_index(op.f('ix_entry_tokens_registration_id'), table_name='entry_tokens')
     op.create_index(op.f('ix_entry_tokens_registration_id'), 'entry_tokens', ['registration_id'], unique=True)
-    op.drop_index(op.f('ix_entry_tokens_token_hash'), table_name='entry_tokens')
+    op.drop_index(op.f('ix_entry_tokens_token_hash'), table_name='entry_tokens', if_exists=True)
     op.create_index(op.f('ix_entry_tokens_token_hash'), 'entry_tokens', ['token_hash'], unique=True)
     op.create_index(op.f('ix_entry_tokens_id'), 'entry_tokens', ['id'], unique=False)
     op.drop_constraint(op.f('participants_user_id_key'), 'participants', type_='unique')
@@ -83,7 +83,7 @@ def upgrade() -> None:
     op.drop_constraint(op.f('scans_uploaded_by_fkey'), 'scans', type_='foreignkey')
     op.create_foreign_key(None, 'scans', 'users', ['uploaded_by'], ['id'], ondelete='SET NULL')
     op.drop_constraint(op.f('users_email_key'), 'users', type_='unique')
-    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users', if_exists=True)
     op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
     op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
     # ### end Alembic commands ###
@@ -1,17 +1,17 @@
 """Script to create test data: competitions and participant accounts."""
 
 import asyncio
+import os
 from uuid import uuid4
 from datetime import datetime, timedelta
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert, select
 
-from src.olimpqr.config import settings
-from src.olimpqr.infrastructure.repositories import (
-    UserRepositoryImpl,
-    ParticipantRepositoryImpl,
-    CompetitionRepositoryImpl,
+from src.olimpqr.infrastructure.database import engine, async_session_maker
+from src.olimpqr.infrastructure.database.models import (
+    CompetitionModel,
+    ParticipantModel,
+    UserModel,
 )
 from src.olimpqr.infrastructure.security import hash_password
 from src.olimpqr.domain.entities import User, Participant, Competition
@@ -21,30 +21,22 @@ from src.olimpqr.domain.value_objects import UserRole, CompetitionStatus
 async def create_test_data():
     """Create test competitions and participant accounts."""
 
-    # Create async engine and session
-    engine = create_async_engine(settings.database_url, echo=True)
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-
-    async with async_session() as session:
-        user_repo = UserRepositoryImpl(session)
-        participant_repo = ParticipantRepositoryImpl(session)
-        competition_repo = CompetitionRepositoryImpl(session)
+    # Per-statement SQL logging is opt-in: set SQL_ECHO=1 to debug
+    if os.environ.get("SQL_ECHO"):
+        engine.echo = True
 
+    async with async_session_maker() as session:
         # Use existing admin user ID (admin@admin.com)
         admin_user_id = uuid4()  # Will be replaced with actual admin ID
         try:
             # Try to find admin user by email
-            from sqlalchemy import select
-            from src.olimpqr.infrastructure.database.models import UserModel
             result = await session.execute(
-                select(UserModel).where(UserModel.email == "admin@admin.com")
+                select(UserModel.id).where(UserModel.email == "admin@admin.com")
             )
-            admin_model = result.scalar_one_or_none()
-            if admin_model:
-                admin_user_id = admin_model.id
-                print(f"Using admin user: {admin_model.email}")
+            admin_id = result.scalar_one_or_none()
+            if admin_id:
+                admin_user_id = admin_id
+                print("Using admin user: admin@admin.com")
         except Exception as e:
             print(f"Could not find admin user, using placeholder ID: {e}")
 
@@ -71,12 +63,30 @@ async def create_test_data():
             )
             # Open registration
             competition.open_registration()
-
-            created_comp = await competition_repo.create(competition)
-            created_competitions.append(created_comp)
-            print(f"✓ Created competition: {created_comp.name}")
-
-        await session.commit()
+            created_competitions.append(competition)
+
+        # Single executemany INSERT instead of one round-trip per competition
+        await session.execute(
+            insert(CompetitionModel),
+            [
+                {
+                    "id": c.id,
+                    "name": c.name,
+                    "date": c.date,
+                    "registration_start": c.registration_start,
+                    "registration_end": c.registration_end,
+                    "variants_count": c.variants_count,
+                    "max_score": c.max_score,
+                    "status": c.status,
+                    "created_by": c.created_by,
+                    "created_at": c.created_at,
+                    "updated_at": c.updated_at,
+                }
+                for c in created_competitions
+            ],
+        )
+        for c in created_competitions:
+            print(f"✓ Created competition: {c.name}")
 
         print("\n=== Creating Test Participant Accounts ===")
 
@@ -88,12 +98,23 @@ async def create_test_data():
             "Лицей №3",
         ]
 
-        for i in range(1, 11):
-            email = f"test{i}@mail.ru"
-            password = "12345678"
-
+        password = "12345678"
+        # All seed accounts share one password, so bcrypt runs once.
+        # Reusing a hash is only acceptable for test seed data.
+        shared_hash = hash_password(password)
+
+        emails = [f"test{i}@mail.ru" for i in range(1, 11)]
+        # One query for all seed emails instead of a lookup per account
+        result = await session.execute(
+            select(UserModel.email).where(UserModel.email.in_(emails))
+        )
+        existing = set(result.scalars().all())
+
+        user_rows = []
+        participant_rows = []
+        for i, email in enumerate(emails, start=1):
             # Check if user already exists
-            if await user_repo.exists_by_email(email):
+            if email in existing:
                 print(f"⊘ User {email} already exists, skipping...")
                 continue
 
@@ -101,23 +122,45 @@ async def create_test_data():
             user = User(
                 id=uuid4(),
                 email=email,
-                password_hash=hash_password(password),
+                password_hash=shared_hash,
                 role=UserRole.PARTICIPANT,
             )
-            created_user = await user_repo.create(user)
 
             # Create participant profile
             participant = Participant(
                 id=uuid4(),
-                user_id=created_user.id,
+                user_id=user.id,
                 full_name=f"Тестовый Участник {i}",
                 school=schools[i % len(schools)],
                 grade=7 + (i % 5),  # Grades 7-11
             )
-            await participant_repo.create(participant)
 
+            user_rows.append({
+                "id": user.id,
+                "email": user.email,
+                "password_hash": user.password_hash,
+                "role": user.role,
+                "is_active": user.is_active,
+                "created_at": user.created_at,
+                "updated_at": user.updated_at,
+            })
+            participant_rows.append({
+                "id": participant.id,
+                "user_id": participant.user_id,
+                "full_name": participant.full_name,
+                "school": participant.school,
+                "grade": participant.grade,
+                "created_at": participant.created_at,
+                "updated_at": participant.updated_at,
+            })
             print(f"✓ Created participant: {email} (password: {password})")
 
+        # Bulk INSERTs, which SQLAlchemy batches into multi-row VALUES
+        # ("insertmanyvalues"); users first so the participants' FK targets exist
+        if user_rows:
+            await session.execute(insert(UserModel), user_rows)
+            await session.execute(insert(ParticipantModel), participant_rows)
+        # Competitions and accounts land in one transaction: one commit, one fsync
         await session.commit()
 
         print("\n=== Summary ===")
@@ -126,6 +169,8 @@ async def create_test_data():
         print(f"Password for all accounts: 12345678")
         print("\nTest data created successfully!")
 
+    await engine.dispose()
+
 
 if __name__ == "__main__":
     asyncio.run(create_test_data())
@@ -17,15 +17,18 @@ import sys
 import os
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from uuid import uuid4
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from olimpqr.config import settings
-from olimpqr.infrastructure.database.base import Base
+from olimpqr.infrastructure.database import engine
 from olimpqr.infrastructure.database.models import UserModel
 from olimpqr.infrastructure.security import hash_password
 from olimpqr.domain.value_objects import UserRole
@@ -42,39 +45,28 @@ async def create_admin_user():
         print("Example: ADMIN_PASSWORD=YourSecurePassword123 python scripts/init_admin.py")
         sys.exit(1)
 
-    # Create async engine
-    engine = create_async_engine(settings.database_url, echo=True)
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-
-    async with async_session() as session:
-        # Check if admin already exists
-        from sqlalchemy import select
-        result = await session.execute(
-            select(UserModel).where(
-                UserModel.email == admin_email,
-                UserModel.role == UserRole.ADMIN
-            )
-        )
-        existing_admin = result.scalar_one_or_none()
-
-        if existing_admin:
-            print(f"Admin user already exists: {admin_email}")
-            print("Skipping creation.")
-            return
-
-        # Create new admin user
-        admin_user = UserModel(
+    # Single atomic statement: no SELECT-then-INSERT race on the email
+    stmt = (
+        pg_insert(UserModel)
+        .values(
             id=uuid4(),
             email=admin_email,
             password_hash=hash_password(admin_password),
             role=UserRole.ADMIN,
-            is_active=True
+            is_active=True,
         )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(UserModel.id)
+    )
+
+    try:
+        async with engine.begin() as conn:
+            created_id = (await conn.execute(stmt)).scalar_one_or_none()
 
-        session.add(admin_user)
-        await session.commit()
+        if created_id is None:
+            print(f"User already exists: {admin_email}")
+            print("Skipping creation.")
+            return
 
         print("=" * 60)
         print("✓ Admin user created successfully!")
@@ -84,9 +76,12 @@ async def create_admin_user():
         print("=" * 60)
         print("\nIMPORTANT: Save these credentials in a secure location!")
         print("You can now log in to the admin panel with these credentials.")
-
-    await engine.dispose()
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(create_admin_user())
+    # uvloop ships with uvicorn[standard] but does not exist on Windows
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(create_admin_user())
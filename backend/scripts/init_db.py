@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Create the database schema for a fresh install.
+
+Replaying every migration on an empty database pays for intermediate
+table rewrites and data backfills that have nothing to migrate. This
+script instead builds the current schema straight from the ORM models
+(the same metadata autogenerate compares against) and stamps the
+database at the Alembic head, so later `alembic upgrade head` runs
+only apply newer revisions.
+
+Existing databases are left alone: if any table is present the script
+exits and the regular migration chain must be used.
+
+Usage:
+    python scripts/init_db.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Enum as SQLEnum, inspect
+from sqlalchemy.dialects import postgresql
+from olimpqr.infrastructure.database import Base, engine
+import olimpqr.infrastructure.database.models  # noqa: F401  (register models)
+
+ALEMBIC_INI = Path(__file__).parent.parent / "alembic.ini"
+
+
+def _enum_types() -> dict[str, postgresql.ENUM]:
+    """Collect native enum types; models declare them with create_type=False."""
+    enums: dict[str, postgresql.ENUM] = {}
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if isinstance(column.type, SQLEnum) and column.type.name:
+                enums[column.type.name] = postgresql.ENUM(
+                    *column.type.enums, name=column.type.name
+                )
+    return enums
+
+
+async def create_schema() -> bool:
+    """Create enum types and tables on an empty database.
+
+    Returns:
+        True if the schema was created, False if the database is not empty
+    """
+    try:
+        async with engine.begin() as conn:
+            tables = await conn.run_sync(lambda c: inspect(c).get_table_names())
+            if tables:
+                return False
+
+            for enum in _enum_types().values():
+                await conn.run_sync(enum.create, checkfirst=True)
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+    return True
+
+
+def main() -> None:
+    if not asyncio.run(create_schema()):
+        print("Database is not empty, skipping. Use `alembic upgrade head` instead.")
+        sys.exit(1)
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "alembic"))
+    # Outside the event loop: alembic's env.py runs its own asyncio.run()
+    command.stamp(config, "head")
+    print("✓ Schema created and stamped at the current Alembic head")
+
+
+if __name__ == "__main__":
+    main()
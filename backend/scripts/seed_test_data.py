@@ -7,13 +7,16 @@ from pathlib import Path
 from uuid import uuid4
 from datetime import date, datetime, timedelta
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
-from olimpqr.config import settings
+from olimpqr.infrastructure.database import engine, async_session_maker
 from olimpqr.infrastructure.database.models import (
     UserModel,
     ParticipantModel,
@@ -23,16 +26,30 @@ from olimpqr.infrastructure.security import hash_password
 from olimpqr.domain.value_objects import UserRole, CompetitionStatus
 
 
-async def seed():
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+async def _hash_passwords(passwords: list[str]) -> dict[str, str]:
+    """bcrypt each distinct seed password once, all in parallel.
+
+    bcrypt releases the GIL while hashing, so worker threads use every core
+    without a process pool's start-up and pickling cost. Accounts sharing a
+    password get the same hash, which is only acceptable for test seed data.
+    """
+    unique = sorted(set(passwords))
+    hashed = await asyncio.gather(
+        *(asyncio.to_thread(hash_password, password) for password in unique)
+    )
+    return dict(zip(unique, hashed))
 
-    async with async_session() as session:
+
+async def seed():
+    async with async_session_maker() as session:
         # ── Find admin user for created_by ──
+        # Plain columns: no UserModel instance, no selectin load of participant
         result = await session.execute(
-            select(UserModel).where(UserModel.role == UserRole.ADMIN)
+            select(UserModel.id, UserModel.email)
+            .where(UserModel.role == UserRole.ADMIN)
+            .limit(1)
         )
-        admin = result.scalar_one_or_none()
+        admin = result.first()
         if not admin:
             print("ERROR: No admin user found. Run create_admin.bat first.")
             return
@@ -44,35 +61,39 @@ async def seed():
                       "55555555", "66666666", "77777777", "88888888",
                       "12345678", "12345678"]
 
-        for i in range(11, 21):
-            email = f"test{i}@mail.ru"
-            # Check if already exists
-            result = await session.execute(
-                select(UserModel).where(UserModel.email == email)
-            )
-            if result.scalar_one_or_none():
+        emails = [f"test{i}@mail.ru" for i in range(11, 21)]
+        result = await session.execute(
+            select(UserModel.email).where(UserModel.email.in_(emails))
+        )
+        existing_emails = set(result.scalars().all())
+
+        new_users = []
+        for i, email in enumerate(emails, start=11):
+            if email in existing_emails:
                 print(f"  User {email} already exists, skipping")
-                continue
+            else:
+                new_users.append((i, email, passwords[i - 11]))
+
+        hashes = await _hash_passwords([pwd for _, _, pwd in new_users])
 
-            pwd = passwords[i - 11]
+        user_rows = []
+        participant_rows = []
+        for i, email, pwd in new_users:
             user_id = uuid4()
-            user = UserModel(
-                id=user_id,
-                email=email,
-                password_hash=hash_password(pwd),
-                role=UserRole.PARTICIPANT,
-                is_active=True,
-            )
-            session.add(user)
-
-            participant = ParticipantModel(
-                id=uuid4(),
-                user_id=user_id,
-                full_name=f"Участник {i}",
-                school=f"Школа №{i}",
-                grade=min(11, max(5, (i - 11) + 5)),
-            )
-            session.add(participant)
+            user_rows.append({
+                "id": user_id,
+                "email": email,
+                "password_hash": hashes[pwd],
+                "role": UserRole.PARTICIPANT,
+                "is_active": True,
+            })
+            participant_rows.append({
+                "id": uuid4(),
+                "user_id": user_id,
+                "full_name": f"Участник {i}",
+                "school": f"Школа №{i}",
+                "grade": min(11, max(5, (i - 11) + 5)),
+            })
             print(f"  Created {email}  password={pwd}")
 
         # ── Create olympiads ──
@@ -119,29 +140,40 @@ async def seed():
             },
         ]
 
-        for o in olympiads:
-            # Check by name
-            result = await session.execute(
-                select(CompetitionModel).where(CompetitionModel.name == o["name"])
+        # One executemany per table; users first so participant FKs resolve
+        if user_rows:
+            await session.execute(insert(UserModel), user_rows)
+            await session.execute(insert(ParticipantModel), participant_rows)
+
+        result = await session.execute(
+            select(CompetitionModel.name).where(
+                CompetitionModel.name.in_([o["name"] for o in olympiads])
             )
-            if result.scalar_one_or_none():
+        )
+        existing_names = set(result.scalars().all())
+
+        competition_rows = []
+        for o in olympiads:
+            if o["name"] in existing_names:
                 print(f"  Competition '{o['name']}' already exists, skipping")
                 continue
 
-            comp = CompetitionModel(
-                id=uuid4(),
-                name=o["name"],
-                date=o["date"],
-                registration_start=o["reg_start"],
-                registration_end=o["reg_end"],
-                variants_count=o["variants"],
-                max_score=o["max_score"],
-                status=CompetitionStatus.REGISTRATION_OPEN,
-                created_by=admin_id,
-            )
-            session.add(comp)
+            competition_rows.append({
+                "id": uuid4(),
+                "name": o["name"],
+                "date": o["date"],
+                "registration_start": o["reg_start"],
+                "registration_end": o["reg_end"],
+                "variants_count": o["variants"],
+                "max_score": o["max_score"],
+                "status": CompetitionStatus.REGISTRATION_OPEN,
+                "created_by": admin_id,
+            })
             print(f"  Created competition: {o['name']}")
 
+        if competition_rows:
+            await session.execute(insert(CompetitionModel), competition_rows)
+
         await session.commit()
 
     await engine.dispose()
@@ -149,4 +181,7 @@ async def seed():
 
 
 if __name__ == "__main__":
-    asyncio.run(seed())
+    # uvloop ships with uvicorn[standard] but does not exist on Windows
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(seed())
@@ -7,7 +7,7 @@ from uuid import UUID
 from ...domain.value_objects import UserRole
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegisterUserDTO:
     """DTO for user registration."""
     email: str
@@ -20,14 +20,14 @@ class RegisterUserDTO:
     dob: dt.date | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoginUserDTO:
     """DTO for user login."""
     email: str
     password: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthResponseDTO:
     """DTO for authentication response."""
     access_token: str
@@ -9,7 +9,7 @@ from uuid import UUID
 from ...domain.value_objects import CompetitionStatus
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateCompetitionDTO:
     """DTO for creating a competition."""
     name: str
@@ -20,7 +20,7 @@ class CreateCompetitionDTO:
     max_score: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdateCompetitionDTO:
     """DTO for updating a competition. All fields are optional."""
     name: str | None = None
@@ -31,7 +31,7 @@ class UpdateCompetitionDTO:
     max_score: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompetitionDTO:
     """DTO for competition data."""
     id: UUID
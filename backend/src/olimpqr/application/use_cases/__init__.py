@@ -12,7 +12,6 @@ from .competitions import (
 from .registration import (
     RegisterForCompetitionUseCase,
     GetEntryQRUseCase,
-    GetParticipantRegistrationsUseCase
 )
 from .admission import (
     VerifyEntryQRUseCase,
@@ -30,7 +29,6 @@ __all__ = [
     "ChangeCompetitionStatusUseCase",
     "RegisterForCompetitionUseCase",
     "GetEntryQRUseCase",
-    "GetParticipantRegistrationsUseCase",
     "VerifyEntryQRUseCase",
     "ApproveAdmissionUseCase",
 ]
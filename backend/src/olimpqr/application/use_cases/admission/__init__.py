@@ -1,11 +1,12 @@
 """Admission use cases."""
 
-from .verify_entry_qr import VerifyEntryQRUseCase, VerifyEntryQRResult
+from .verify_entry_qr import VerifyEntryQRUseCase, VerifyEntryQRResult, VerifyEntryQRBatchItem
 from .approve_admission import ApproveAdmissionUseCase, ApproveAdmissionResult
 
 __all__ = [
     "VerifyEntryQRUseCase",
     "VerifyEntryQRResult",
+    "VerifyEntryQRBatchItem",
     "ApproveAdmissionUseCase",
     "ApproveAdmissionResult",
 ]
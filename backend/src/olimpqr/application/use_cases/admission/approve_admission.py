@@ -15,22 +15,53 @@ from ....domain.repositories import (
     AnswerSheetRepository,
     RoomRepository,
     SeatAssignmentRepository,
-    ParticipantRepository,
 )
 from ....domain.services import TokenService
-from ....infrastructure.pdf import SheetGenerator
-from ....infrastructure.storage import MinIOStorage
 from ....config import settings
 from ..seating import AssignSeatUseCase
 
 
-@dataclass
+class VariantDeck:
+    """Deals variants from a shuffled deck per competition.
+
+    Every variant is dealt once before any repeats, so the fallback
+    assignment stays balanced instead of drifting like independent draws.
+    The deck lives in process memory; each worker keeps its own.
+    """
+
+    def __init__(self):
+        self._decks: dict[UUID, list[int]] = {}
+
+    def deal(self, competition_id: UUID, variants_count: int) -> int:
+        """Take the next variant for a competition, reshuffling when empty."""
+        deck = self._decks.get(competition_id)
+        if not deck or max(deck) > variants_count:
+            deck = list(range(1, variants_count + 1))
+            random.shuffle(deck)
+            self._decks[competition_id] = deck
+        return deck.pop()
+
+
+_variant_deck = VariantDeck()
+
+
+@dataclass(slots=True, frozen=True)
+class SheetRenderJob:
+    """Arguments for the background render of an answer sheet PDF."""
+    competition_name: str
+    variant_number: int
+    sheet_token: str
+    object_name: str
+
+
+@dataclass(slots=True, frozen=True)
 class ApproveAdmissionResult:
     """Result of admission approval."""
     attempt_id: UUID
     variant_number: int
     pdf_url: str
     sheet_token: str  # raw token for QR code on sheet
+    sheet_render: SheetRenderJob  # enqueue once the transaction commits
     room_name: str | None = None
     seat_number: int | None = None
 
@@ -42,13 +73,16 @@ class ApproveAdmissionUseCase:
     1. Mark entry token as used (one-time use)
     2. Update registration status to ADMITTED
     3. Assign seat (room + seat + variant) via seating algorithm
-    4. Fall back to random variant if no rooms configured
+    4. Fall back to a shuffled variant deck if no rooms configured
     5. Generate sheet token (for answer sheet QR)
     6. Create Attempt entity
     7. Create AnswerSheet(kind=primary)
-    8. Generate PDF answer sheet with QR
-    9. Upload PDF to MinIO
-    10. Log action to audit log
+    8. Log action to audit log
+
+    The PDF is rendered by a background worker. The result carries the
+    render job for the caller to enqueue after committing, so a rolled
+    back admission never leaves a PDF behind. The returned download URL
+    is deterministic and the download endpoint waits for the object.
     """
 
     def __init__(
@@ -60,11 +94,8 @@ class ApproveAdmissionUseCase:
         attempt_repository: AttemptRepository,
         audit_log_repository: AuditLogRepository,
         answer_sheet_repository: AnswerSheetRepository,
-        storage: MinIOStorage,
-        sheet_generator: SheetGenerator,
         room_repository: RoomRepository | None = None,
         seat_assignment_repository: SeatAssignmentRepository | None = None,
-        participant_repository: ParticipantRepository | None = None,
     ):
         self.token_service = token_service
         self.entry_token_repo = entry_token_repository
@@ -73,11 +104,8 @@ class ApproveAdmissionUseCase:
         self.attempt_repo = attempt_repository
         self.audit_log_repo = audit_log_repository
         self.answer_sheet_repo = answer_sheet_repository
-        self.storage = storage
-        self.sheet_generator = sheet_generator
         self.room_repo = room_repository
         self.seat_repo = seat_assignment_repository
-        self.participant_repo = participant_repository
 
     async def execute(
         self,
@@ -102,12 +130,11 @@ class ApproveAdmissionUseCase:
         entry_token.use()
         await self.entry_token_repo.update(entry_token)
 
-        # 3. Update registration status
+        # 3. Update registration status (persisted once, after step 10)
         registration = await self.registration_repo.get_by_id(registration_id)
         if not registration:
             raise ValueError("Регистрация не найдена")
         registration.admit()
-        await self.registration_repo.update(registration)
 
         # 4. Get competition for variant count
         competition = await self.competition_repo.get_by_id(registration.competition_id)
@@ -119,12 +146,11 @@ class ApproveAdmissionUseCase:
         seat_number = None
         variant_number = None
 
-        if self.room_repo and self.seat_repo and self.participant_repo:
+        if self.room_repo and self.seat_repo:
             assign_seat_uc = AssignSeatUseCase(
                 room_repository=self.room_repo,
                 seat_assignment_repository=self.seat_repo,
                 registration_repository=self.registration_repo,
-                participant_repository=self.participant_repo,
             )
             seat_result = await assign_seat_uc.execute(
                 registration_id=registration_id,
@@ -136,9 +162,11 @@ class ApproveAdmissionUseCase:
                 seat_number = seat_result.seat_number
                 variant_number = seat_result.variant_number
 
-        # Fall back to random variant if no seating
+        # Fall back to the shuffled variant deck if no seating
         if variant_number is None:
-            variant_number = random.randint(1, competition.variants_count)
+            variant_number = _variant_deck.deal(
+                competition.id, competition.variants_count
+            )
 
         # 6. Generate sheet token
         sheet_token = self.token_service.generate_token(
@@ -153,27 +181,12 @@ class ApproveAdmissionUseCase:
             sheet_token_hash=sheet_token.hash,
         )
 
-        # 8. Generate PDF
-        pdf_bytes = self.sheet_generator.generate_answer_sheet(
-            competition_name=competition.name,
-            variant_number=variant_number,
-            sheet_token=sheet_token.raw,
-        )
-
-        # 9. Upload PDF to MinIO
+        # 8. Save attempt with file path
         object_name = f"sheets/{competition.id}/{attempt.id}.pdf"
-        self.storage.upload_file(
-            bucket=settings.minio_bucket_sheets,
-            object_name=object_name,
-            data=pdf_bytes,
-            content_type="application/pdf",
-        )
-
-        # 10. Save attempt with file path
         attempt.pdf_file_path = object_name
         await self.attempt_repo.create(attempt)
 
-        # 11. Create AnswerSheet(kind=primary)
+        # 9. Create AnswerSheet(kind=primary)
         answer_sheet = AnswerSheet(
             id=uuid4(),
             attempt_id=attempt.id,
@@ -183,11 +196,12 @@ class ApproveAdmissionUseCase:
         )
         await self.answer_sheet_repo.create(answer_sheet)
 
-        # 12. Mark registration as completed (sheet given)
+        # 10. Mark registration as completed (sheet given); a single write
+        # covers both the ADMITTED and COMPLETED transitions
         registration.complete()
         await self.registration_repo.update(registration)
 
-        # 13. Audit log
+        # 11. Audit log
         audit = AuditLog.create_log(
             entity_type="registration",
             entity_id=registration_id,
@@ -201,7 +215,7 @@ class ApproveAdmissionUseCase:
         )
         await self.audit_log_repo.create(audit)
 
-        # 14. Generate backend download URL
+        # 12. Generate backend download URL
         pdf_url = f"admission/sheets/{attempt.id}/download"
 
         return ApproveAdmissionResult(
@@ -209,6 +223,12 @@ class ApproveAdmissionUseCase:
             variant_number=variant_number,
             pdf_url=pdf_url,
             sheet_token=sheet_token.raw,
+            sheet_render=SheetRenderJob(
+                competition_name=competition.name,
+                variant_number=variant_number,
+                sheet_token=sheet_token.raw,
+                object_name=object_name,
+            ),
             room_name=room_name,
             seat_number=seat_number,
         )
@@ -1,9 +1,11 @@
 """Verify entry QR code use case."""
 
 import datetime as dt
+from typing import List
 from uuid import UUID
 from dataclasses import dataclass
 
+from ....domain.entities import Competition, Participant, Registration
 from ....domain.repositories import (
     EntryTokenRepository,
     RegistrationRepository,
@@ -15,7 +17,7 @@ from ....domain.repositories import (
 from ....domain.services import TokenService
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerifyEntryQRResult:
     """Result of entry QR verification."""
     registration_id: UUID
@@ -32,6 +34,13 @@ class VerifyEntryQRResult:
     has_documents: bool = False
 
 
+@dataclass(slots=True, frozen=True)
+class VerifyEntryQRBatchItem:
+    """Outcome for one token of a batch verification."""
+    result: VerifyEntryQRResult | None = None
+    error: str | None = None
+
+
 class VerifyEntryQRUseCase:
     """Verify an entry QR code scanned by an admitter.
 
@@ -65,64 +74,119 @@ class VerifyEntryQRUseCase:
         if not raw_token:
             raise ValueError("Токен не может быть пустым")
 
-        # 1. Compute hash
-        token_hash = self.token_service.hash_token(raw_token)
-
-        # 2. Find entry token by hash
-        entry_token = await self.entry_token_repo.get_by_token_hash(token_hash.value)
-        if not entry_token:
-            raise ValueError("Токен не найден")
+        item = (await self.verify_batch([raw_token]))[0]
+        if item.error:
+            raise ValueError(item.error)
+        return item.result
 
-        # 3. Check expiry
-        if entry_token.is_expired:
-            raise ValueError("Срок действия токена истёк")
+    async def verify_batch(self, raw_tokens: List[str]) -> List[VerifyEntryQRBatchItem]:
+        """Verify many entry QR codes with one query per table.
 
-        # 4. Check if already used
-        if entry_token.is_used:
-            raise ValueError("Токен уже использован")
+        Args:
+            raw_tokens: Raw tokens scanned from QR codes
 
-        # 5. Get registration, participant, competition
-        registration = await self.registration_repo.get_by_id(entry_token.registration_id)
-        if not registration:
-            raise ValueError("Регистрация не найдена")
+        Returns:
+            One item per token, in input order, with either a result or
+            the reason the token was rejected
+        """
+        # 1. Compute hashes
+        computed = iter(self.token_service.hash_tokens([raw for raw in raw_tokens if raw]))
+        hashes = [next(computed).value if raw else None for raw in raw_tokens]
 
-        participant = await self.participant_repo.get_by_id(registration.participant_id)
-        if not participant:
-            raise ValueError("Участник не найден")
+        # 2. Find entry tokens by hash
+        tokens = await self.entry_token_repo.get_by_token_hashes(
+            [h for h in hashes if h]
+        )
 
-        competition = await self.competition_repo.get_by_id(registration.competition_id)
-        if not competition:
-            raise ValueError("Олимпиада не найдена")
+        # 3-4. Only unexpired, unused tokens need their registrations; one
+        # clock reading keeps this filter and the per-token errors consistent
+        now = dt.datetime.utcnow()
+        live_tokens = {
+            h: t for h, t in tokens.items() if not t.is_expired_at(now) and not t.is_used
+        }
 
-        # 6. Get institution name if available
-        institution_name = None
-        if participant.institution_id and self.institution_repo:
-            institution = await self.institution_repo.get_by_id(participant.institution_id)
-            if institution:
-                institution_name = institution.name
+        # 5. Get registrations, participants, competitions
+        registrations = await self.registration_repo.get_many_by_ids(
+            [t.registration_id for t in live_tokens.values()]
+        )
+        participants = await self.participant_repo.get_many_by_ids(
+            [r.participant_id for r in registrations.values()]
+        )
+        competitions = await self.competition_repo.get_many_by_ids(
+            [r.competition_id for r in registrations.values()]
+        )
 
-        # 7. Check if participant has documents
-        has_documents = False
-        if self.document_repo:
-            docs = await self.document_repo.get_by_participant(participant.id)
-            has_documents = len(docs) > 0
+        # 6. Get institution names if available
+        institutions = {}
+        if self.institution_repo:
+            institution_ids = [
+                p.institution_id for p in participants.values() if p.institution_id
+            ]
+            institutions = await self.institution_repo.get_many_by_ids(institution_ids)
+
+        # 7. Check which participants have documents
+        with_documents = set()
+        if self.document_repo and len(participants) == 1:
+            # Single scan: probe one index entry instead of collecting ids
+            (participant_id,) = participants
+            if await self.document_repo.exists_by_participant(participant_id):
+                with_documents.add(participant_id)
+        elif self.document_repo:
+            with_documents = await self.document_repo.get_participants_with_documents(
+                list(participants)
+            )
 
+        items = []
+        for token_hash in hashes:
+            try:
+                if not token_hash:
+                    raise ValueError("Токен не может быть пустым")
+                entry_token = tokens.get(token_hash)
+                if not entry_token:
+                    raise ValueError("Токен не найден")
+                if entry_token.is_expired_at(now):
+                    raise ValueError("Срок действия токена истёк")
+                if entry_token.is_used:
+                    raise ValueError("Токен уже использован")
+
+                registration = registrations.get(entry_token.registration_id)
+                if not registration:
+                    raise ValueError("Регистрация не найдена")
+                participant = participants.get(registration.participant_id)
+                if not participant:
+                    raise ValueError("Участник не найден")
+                competition = competitions.get(registration.competition_id)
+                if not competition:
+                    raise ValueError("Олимпиада не найдена")
+            except ValueError as e:
+                items.append(VerifyEntryQRBatchItem(error=str(e)))
+                continue
+
+            institution = institutions.get(participant.institution_id)
+            items.append(VerifyEntryQRBatchItem(result=self._build_result(
+                registration,
+                participant,
+                competition,
+                institution.name if institution else None,
+                participant.id in with_documents,
+            )))
+        return items
+
+    @staticmethod
+    def _build_result(
+        registration: Registration,
+        participant: Participant,
+        competition: Competition,
+        institution_name: str | None,
+        has_documents: bool,
+    ) -> VerifyEntryQRResult:
         # 8. Check competition is in progress (admission allowed)
         if not competition.is_in_progress:
-            return VerifyEntryQRResult(
-                registration_id=registration.id,
-                participant_id=participant.id,
-                participant_name=participant.full_name,
-                participant_school=participant.school,
-                participant_grade=participant.grade,
-                competition_name=competition.name,
-                competition_id=competition.id,
-                can_proceed=False,
-                message=f"Олимпиада не в процессе (статус: {competition.status.value})",
-                institution_name=institution_name,
-                dob=participant.dob,
-                has_documents=has_documents,
-            )
+            can_proceed = False
+            message = f"Олимпиада не в процессе (статус: {competition.status.value})"
+        else:
+            can_proceed = True
+            message = "Участник подтверждён. Можно выдать бланк."
 
         return VerifyEntryQRResult(
             registration_id=registration.id,
@@ -132,8 +196,8 @@ class VerifyEntryQRUseCase:
             participant_grade=participant.grade,
             competition_name=competition.name,
             competition_id=competition.id,
-            can_proceed=True,
-            message="Участник подтверждён. Можно выдать бланк.",
+            can_proceed=can_proceed,
+            message=message,
             institution_name=institution_name,
             dob=participant.dob,
             has_documents=has_documents,
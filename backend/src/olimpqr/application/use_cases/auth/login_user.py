@@ -1,7 +1,11 @@
 """Login user use case."""
 
 from ....domain.repositories import UserRepository
-from ....infrastructure.security import verify_password, create_access_token
+from ....infrastructure.security import (
+    verify_password_async,
+    create_access_token,
+    dummy_password_hash_async,
+)
 from ...dto import LoginUserDTO, AuthResponseDTO
 
 
@@ -25,11 +29,12 @@ class LoginUserUseCase:
         """
         # Get user by email
         user = await self.user_repository.get_by_email(dto.email)
-        if not user:
-            raise ValueError("Неверный email или пароль")
 
-        # Verify password
-        if not verify_password(dto.password, user.password_hash):
+        # Verify password off the event loop. Unknown emails are checked
+        # against a dummy hash to take the same time as a wrong password.
+        password_hash = user.password_hash if user else await dummy_password_hash_async()
+        password_ok = await verify_password_async(dto.password, password_hash)
+        if not user or not password_ok:
             raise ValueError("Неверный email или пароль")
 
         # Check if user is active
@@ -5,7 +5,7 @@ from uuid import uuid4
 from ....domain.entities import User, Participant
 from ....domain.repositories import UserRepository, ParticipantRepository
 from ....domain.value_objects import UserRole
-from ....infrastructure.security import hash_password, create_access_token
+from ....infrastructure.security import hash_password_async, create_access_token
 from ...dto import RegisterUserDTO, AuthResponseDTO
 
 
@@ -44,7 +44,7 @@ class RegisterUserUseCase:
                 raise ValueError("Класс должен быть от 1 до 12")
 
         # Hash password
-        password_hash = hash_password(dto.password)
+        password_hash = await hash_password_async(dto.password)
 
         # Create user entity
         user = User(
@@ -55,10 +55,7 @@ class RegisterUserUseCase:
             is_active=True
         )
 
-        # Save user
-        user = await self.user_repository.create(user)
-
-        # Create participant profile if role is PARTICIPANT
+        # Save user, with the participant profile in the same flush
         if dto.role == UserRole.PARTICIPANT and self.participant_repository:
             participant = Participant(
                 id=uuid4(),
@@ -69,7 +66,9 @@ class RegisterUserUseCase:
                 institution_id=dto.institution_id,
                 dob=dto.dob,
             )
-            await self.participant_repository.create(participant)
+            user = await self.user_repository.create_with_participant(user, participant)
+        else:
+            user = await self.user_repository.create(user)
 
         # Generate JWT token
         access_token = create_access_token(
@@ -6,6 +6,14 @@ from ....domain.entities import Competition
 from ....domain.repositories import CompetitionRepository
 from ....domain.value_objects import CompetitionStatus
 
+# Target status -> entity method enforcing the transition into it
+_TRANSITIONS = {
+    CompetitionStatus.REGISTRATION_OPEN: Competition.open_registration,
+    CompetitionStatus.IN_PROGRESS: Competition.start_competition,
+    CompetitionStatus.CHECKING: Competition.start_checking,
+    CompetitionStatus.PUBLISHED: Competition.publish_results,
+}
+
 
 class ChangeCompetitionStatusUseCase:
     """Use case for changing competition status."""
@@ -32,18 +40,17 @@ class ChangeCompetitionStatusUseCase:
             raise ValueError(f"Олимпиада с id {competition_id} не найдена")
 
         # Use entity methods for status transitions
-        if new_status == CompetitionStatus.REGISTRATION_OPEN:
-            competition.open_registration()
-        elif new_status == CompetitionStatus.IN_PROGRESS:
-            competition.start_competition()
-        elif new_status == CompetitionStatus.CHECKING:
-            competition.start_checking()
-        elif new_status == CompetitionStatus.PUBLISHED:
-            competition.publish_results()
-        else:
+        transition = _TRANSITIONS.get(new_status)
+        if not transition:
             raise ValueError(f"Недопустимый переход статуса к {new_status}")
+        transition(competition)
 
-        # Save to repository
-        competition = await self.competition_repository.update(competition)
+        # Save only the status change
+        competition = await self.competition_repository.patch(
+            competition_id,
+            {"status": competition.status, "updated_at": competition.updated_at},
+        )
+        if not competition:
+            raise ValueError(f"Олимпиада с id {competition_id} не найдена")
 
         return competition
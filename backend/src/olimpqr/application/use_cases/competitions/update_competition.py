@@ -33,26 +33,35 @@ class UpdateCompetitionUseCase:
             raise ValueError(f"Олимпиада с id {competition_id} не найдена")
 
         # Update fields if provided
-        if dto.name is not None:
-            competition.name = dto.name
-        if dto.date is not None:
-            competition.date = dto.date
-        if dto.registration_start is not None:
-            competition.registration_start = dto.registration_start
-        if dto.registration_end is not None:
-            competition.registration_end = dto.registration_end
-        if dto.variants_count is not None:
-            competition.variants_count = dto.variants_count
-        if dto.max_score is not None:
-            competition.max_score = dto.max_score
+        changed = set()
+        for field in (
+            "name",
+            "date",
+            "registration_start",
+            "registration_end",
+            "variants_count",
+            "max_score",
+        ):
+            value = getattr(dto, field)
+            if value is not None and value != getattr(competition, field):
+                setattr(competition, field, value)
+                changed.add(field)
+
+        # Nothing to write
+        if not changed:
+            return competition
 
         # Update timestamp
         competition.updated_at = datetime.utcnow()
 
-        # Validate the updated entity
-        competition.__post_init__()
+        # Validate only the invariants the changed fields take part in
+        competition.validate(changed)
 
-        # Save to repository
-        competition = await self.competition_repository.update(competition)
+        # Write just the changed columns
+        fields = {field: getattr(competition, field) for field in changed}
+        fields["updated_at"] = competition.updated_at
+        competition = await self.competition_repository.patch(competition_id, fields)
+        if not competition:
+            raise ValueError(f"Олимпиада с id {competition_id} не найдена")
 
         return competition
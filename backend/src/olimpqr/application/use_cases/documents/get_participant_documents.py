@@ -7,7 +7,7 @@ from uuid import UUID
 from ....domain.repositories import DocumentRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentItem:
     id: UUID
     file_path: str
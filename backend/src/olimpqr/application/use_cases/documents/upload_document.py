@@ -1,6 +1,8 @@
 """Upload document use case."""
 
+import asyncio
 from dataclasses import dataclass
+from typing import BinaryIO
 from uuid import UUID
 
 from ....domain.entities import Document
@@ -9,7 +11,7 @@ from ....infrastructure.storage import MinIOStorage
 from ....config import settings
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UploadDocumentResult:
     id: UUID
     file_path: str
@@ -32,7 +34,7 @@ class UploadDocumentUseCase:
     async def execute(
         self,
         participant_id: UUID,
-        file_data: bytes,
+        file_data: bytes | BinaryIO,
         file_type: str,
         original_filename: str,
     ) -> UploadDocumentResult:
@@ -42,7 +44,10 @@ class UploadDocumentUseCase:
 
         # Upload to storage
         object_name = f"documents/{participant_id}/{original_filename}"
-        self.storage.upload_file(
+        # Blocking SDK call: run it off the event loop. A file object is
+        # streamed to MinIO from its current position, never read whole
+        await asyncio.to_thread(
+            self.storage.upload_file,
             bucket=settings.minio_bucket_sheets,
             object_name=object_name,
             data=file_data,
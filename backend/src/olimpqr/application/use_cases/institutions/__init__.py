@@ -1,11 +1,13 @@
 """Institution use cases."""
 
 from .create_institution import CreateInstitutionUseCase
+from .create_institutions_bulk import CreateInstitutionsBulkUseCase
 from .list_institutions import ListInstitutionsUseCase
 from .search_institutions import SearchInstitutionsUseCase
 
 __all__ = [
     "CreateInstitutionUseCase",
+    "CreateInstitutionsBulkUseCase",
     "ListInstitutionsUseCase",
     "SearchInstitutionsUseCase",
 ]
@@ -7,7 +7,7 @@ from ....domain.entities import Institution
 from ....domain.repositories import InstitutionRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateInstitutionResult:
     id: UUID
     name: str
@@ -24,12 +24,10 @@ class CreateInstitutionUseCase:
     async def execute(
         self, name: str, short_name: str | None = None, city: str | None = None
     ) -> CreateInstitutionResult:
-        existing = await self.institution_repo.get_by_name(name)
-        if existing:
-            raise ValueError("Учреждение с таким названием уже существует")
-
         institution = Institution(name=name, short_name=short_name, city=city)
-        await self.institution_repo.create(institution)
+        # The insert skips existing names, so the check and write are one query
+        if not await self.institution_repo.create_many([institution]):
+            raise ValueError("Учреждение с таким названием уже существует")
 
         return CreateInstitutionResult(
             id=institution.id,
@@ -0,0 +1,58 @@
+"""Bulk create institutions use case."""
+
+from dataclasses import dataclass
+
+from ....domain.entities import Institution
+from ....domain.repositories import InstitutionRepository
+from .create_institution import CreateInstitutionResult
+
+
+@dataclass(slots=True, frozen=True)
+class CreateInstitutionsBulkResult:
+    created: list[CreateInstitutionResult]
+    duplicates: int
+    existing: int
+
+
+class CreateInstitutionsBulkUseCase:
+    """Import many institutions at once, skipping existing names."""
+
+    def __init__(self, institution_repository: InstitutionRepository):
+        self.institution_repo = institution_repository
+
+    async def execute(
+        self, items: list[tuple[str, str | None, str | None]]
+    ) -> CreateInstitutionsBulkResult:
+        """Create institutions from (name, short_name, city) tuples.
+
+        Names are matched exactly, as the unique index on institutions.name
+        and get_by_name compare them. A name repeated within the batch keeps
+        its first occurrence and counts as a duplicate; a name already in
+        the database counts as existing.
+
+        Raises:
+            ValueError: If any name fails Institution validation
+        """
+        seen = set()
+        institutions = []
+        for name, short_name, city in items:
+            if name in seen:
+                continue
+            seen.add(name)
+            institutions.append(Institution(name=name, short_name=short_name, city=city))
+
+        created = await self.institution_repo.create_many(institutions)
+
+        return CreateInstitutionsBulkResult(
+            created=[
+                CreateInstitutionResult(
+                    id=institution.id,
+                    name=institution.name,
+                    short_name=institution.short_name,
+                    city=institution.city,
+                )
+                for institution in created
+            ],
+            duplicates=len(items) - len(institutions),
+            existing=len(institutions) - len(created),
+        )
@@ -7,7 +7,7 @@ from ....domain.entities import Institution
 from ....domain.repositories import InstitutionRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstitutionItem:
     id: UUID
     name: str
@@ -6,7 +6,7 @@ from uuid import UUID
 from ....domain.repositories import InstitutionRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstitutionSearchItem:
     id: UUID
     name: str
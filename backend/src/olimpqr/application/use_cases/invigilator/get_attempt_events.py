@@ -7,7 +7,7 @@ from uuid import UUID
 from ....domain.repositories import ParticipantEventRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EventItem:
     id: UUID
     attempt_id: UUID
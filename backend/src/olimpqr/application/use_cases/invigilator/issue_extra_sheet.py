@@ -1,6 +1,8 @@
 """Issue extra answer sheet use case."""
 
+import asyncio
 from dataclasses import dataclass
+from io import BytesIO
 from uuid import UUID, uuid4
 
 from ....domain.entities import AnswerSheet
@@ -12,7 +14,7 @@ from ....infrastructure.storage import MinIOStorage
 from ....config import settings
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IssueExtraSheetResult:
     answer_sheet_id: UUID
     sheet_token: str
@@ -54,24 +56,31 @@ class IssueExtraSheetUseCase:
             kind=SheetKind.EXTRA,
         )
 
-        # Generate PDF
-        pdf_bytes = self.sheet_generator.generate_answer_sheet(
-            competition_name="Extra Sheet",
-            variant_number=attempt.variant_number,
-            sheet_token=sheet_token.raw,
-        )
-
-        # Upload PDF
         object_name = f"sheets/extra/{attempt_id}/{answer_sheet.id}.pdf"
-        self.storage.upload_file(
-            bucket=settings.minio_bucket_sheets,
-            object_name=object_name,
-            data=pdf_bytes,
-            content_type="application/pdf",
-        )
-
         answer_sheet.pdf_file_path = object_name
-        await self.answer_sheet_repo.create(answer_sheet)
+
+        # Render + upload in a worker thread while the row is inserted. Both
+        # settle before anything is raised, so the request transaction never
+        # rolls back under a flush that is still running
+        uploaded, inserted = await asyncio.gather(
+            asyncio.to_thread(
+                self._render_and_upload,
+                object_name=object_name,
+                variant_number=attempt.variant_number,
+                sheet_token=sheet_token.raw,
+            ),
+            self.answer_sheet_repo.create(answer_sheet),
+            return_exceptions=True,
+        )
+        if isinstance(inserted, BaseException):
+            if not isinstance(uploaded, BaseException):
+                # No row will point at the uploaded PDF
+                await asyncio.to_thread(
+                    self.storage.delete_file, settings.minio_bucket_sheets, object_name
+                )
+            raise inserted
+        if isinstance(uploaded, BaseException):
+            raise uploaded
 
         pdf_url = f"admission/sheets/{attempt_id}/download"
 
@@ -80,3 +89,20 @@ class IssueExtraSheetUseCase:
             sheet_token=sheet_token.raw,
             pdf_url=pdf_url,
         )
+
+    def _render_and_upload(self, object_name: str, variant_number: int, sheet_token: str) -> None:
+        """Render the sheet PDF and upload it; blocking, run in a thread."""
+        pdf_stream = BytesIO()
+        self.sheet_generator.write_answer_sheet(
+            pdf_stream,
+            competition_name="Extra Sheet",
+            variant_number=variant_number,
+            sheet_token=sheet_token,
+        )
+        pdf_stream.seek(0)
+        self.storage.upload_file(
+            bucket=settings.minio_bucket_sheets,
+            object_name=object_name,
+            data=pdf_stream,
+            content_type="application/pdf",
+        )
@@ -9,7 +9,7 @@ from ....domain.value_objects import EventType
 from ....domain.repositories import ParticipantEventRepository, AttemptRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecordEventResult:
     id: UUID
     attempt_id: UUID
@@ -39,11 +39,14 @@ class RecordEventUseCase:
         if not attempt:
             raise ValueError("Попытка не найдена")
 
+        # Read the clock once; columns are naive UTC like everywhere else
+        now = datetime.utcnow()
         event = ParticipantEvent(
             attempt_id=attempt_id,
             event_type=event_type,
             recorded_by=recorded_by,
-            timestamp=timestamp or datetime.utcnow(),
+            timestamp=timestamp or now,
+            created_at=now,
         )
         await self.event_repo.create(event)
 
@@ -2,10 +2,8 @@
 
 from .register_for_competition import RegisterForCompetitionUseCase
 from .get_entry_qr import GetEntryQRUseCase
-from .get_participant_registrations import GetParticipantRegistrationsUseCase
 
 __all__ = [
     "RegisterForCompetitionUseCase",
     "GetEntryQRUseCase",
-    "GetParticipantRegistrationsUseCase",
 ]
@@ -12,7 +12,7 @@ from ....domain.repositories import (
 from ....domain.services import QRService
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EntryQRResult:
     """Result with QR code data."""
     qr_code_base64: str
@@ -50,30 +50,8 @@ class GetEntryQRUseCase:
             QR code data
 
         Raises:
-            ValueError: If validation fails
+            ValueError: Always; the token is shown only at registration
         """
-        # Get registration
-        registration = await self.registration_repository.get_by_id(registration_id)
-        if not registration:
-            raise ValueError("Регистрация не найдена")
-
-        # Get participant
-        participant = await self.participant_repository.get_by_id(registration.participant_id)
-        if not participant:
-            raise ValueError("Участник не найден")
-
-        # Verify ownership
-        if participant.user_id != user_id:
-            raise ValueError("Доступ запрещён: это не ваша регистрация")
-
-        # Get entry token
-        entry_token = await self.entry_token_repository.get_by_registration(registration_id)
-        if not entry_token:
-            raise ValueError("Токен допуска не найден")
-
-        # Note: We don't expose the raw token from DB (it's not stored)
-        # The QR code was already generated during registration
-        # This endpoint should return error - token can only be retrieved once during registration
-        
-        # For now, raise error - in production, token should be stored temporarily or returned only once
+        # The raw token is not stored, so it can only be returned once,
+        # during registration; fail before touching the database
         raise ValueError("Токен допуска можно получить только во время регистрации. Обратитесь к администратору.")
@@ -8,13 +8,12 @@ from ....domain.repositories import (
     RegistrationRepository,
     CompetitionRepository,
     ParticipantRepository,
-    EntryTokenRepository
 )
 from ....domain.services import TokenService
 from ....config import settings
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegisterForCompetitionResult:
     """Result of registration."""
     registration_id: UUID
@@ -29,13 +28,11 @@ class RegisterForCompetitionUseCase:
         registration_repository: RegistrationRepository,
         competition_repository: CompetitionRepository,
         participant_repository: ParticipantRepository,
-        entry_token_repository: EntryTokenRepository,
         token_service: TokenService
     ):
         self.registration_repository = registration_repository
         self.competition_repository = competition_repository
         self.participant_repository = participant_repository
-        self.entry_token_repository = entry_token_repository
         self.token_service = token_service
 
     async def execute(
@@ -70,20 +67,11 @@ class RegisterForCompetitionUseCase:
         if not skip_status_check and not competition.is_registration_open:
             raise ValueError("Регистрация на эту олимпиаду закрыта")
 
-        # Check for duplicate registration
-        existing = await self.registration_repository.get_by_participant_and_competition(
-            participant_id, competition_id
-        )
-        if existing:
-            raise ValueError("Вы уже зарегистрированы на эту олимпиаду")
-
-        # Create registration
         registration = Registration(
             id=uuid4(),
             participant_id=participant_id,
             competition_id=competition_id
         )
-        registration = await self.registration_repository.create(registration)
 
         # Generate entry token
         token = self.token_service.generate_token(
@@ -98,7 +86,14 @@ class RegisterForCompetitionUseCase:
         )
         # Store raw token for later retrieval
         entry_token.raw_token = token.raw
-        await self.entry_token_repository.create(entry_token)
+
+        # Write both rows at once; the unique constraint catches duplicates,
+        # including two concurrent requests from the same participant
+        registration = await self.registration_repository.create_with_token(
+            registration, entry_token
+        )
+        if registration is None:
+            raise ValueError("Вы уже зарегистрированы на эту олимпиаду")
 
         return RegisterForCompetitionResult(
             registration_id=registration.id,
@@ -7,7 +7,7 @@ from ....domain.entities import Room
 from ....domain.repositories import RoomRepository, CompetitionRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoomResult:
     id: UUID
     competition_id: UUID
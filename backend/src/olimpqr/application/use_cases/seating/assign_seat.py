@@ -1,18 +1,19 @@
 """Assign seat use case - core seating algorithm."""
 
+from collections import Counter, defaultdict
 from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
 from uuid import UUID
 
-from ....domain.entities import SeatAssignment
+from ....domain.entities import Room, SeatAssignment
 from ....domain.repositories import (
     RoomRepository,
     SeatAssignmentRepository,
     RegistrationRepository,
-    ParticipantRepository,
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssignSeatResult:
     seat_assignment_id: UUID
     room_id: UUID
@@ -21,6 +22,38 @@ class AssignSeatResult:
     variant_number: int
 
 
+def _pick_room(
+    rooms: Sequence[Room], stats: Dict[UUID, Tuple[int, int]]
+) -> Room | None:
+    """Pick the room with fewest same-institution occupants.
+
+    Ties go to the room with most free seats; full rooms are skipped.
+
+    Args:
+        rooms: Candidate rooms
+        stats: (occupied, same-institution) per room ID; missing means empty
+    """
+    best_room = None
+    best_same_inst = float('inf')
+    best_free_seats = -1
+
+    for room in rooms:
+        occupied, same_inst = stats.get(room.id, (0, 0))
+        free_seats = room.capacity - occupied
+
+        if free_seats <= 0:
+            continue  # Room full
+
+        if (same_inst < best_same_inst) or (
+            same_inst == best_same_inst and free_seats > best_free_seats
+        ):
+            best_room = room
+            best_same_inst = same_inst
+            best_free_seats = free_seats
+
+    return best_room
+
+
 class AssignSeatUseCase:
     """Assign a seat to a participant for a competition.
 
@@ -28,7 +61,7 @@ class AssignSeatUseCase:
     1. Check if seat already assigned (idempotent)
     2. Get participant's institution_id
     3. Get all rooms for competition
-    4. For each room, count same-institution occupants
+    4. Count occupants and same-institution occupants of every room at once
     5. Pick room with fewest same-institution participants (tie-break: most free seats)
     6. Find next available seat number
     7. Assign variant: (seat_number % variants_count) + 1
@@ -39,24 +72,22 @@ class AssignSeatUseCase:
         room_repository: RoomRepository,
         seat_assignment_repository: SeatAssignmentRepository,
         registration_repository: RegistrationRepository,
-        participant_repository: ParticipantRepository,
     ):
         self.room_repo = room_repository
         self.seat_repo = seat_assignment_repository
         self.registration_repo = registration_repository
-        self.participant_repo = participant_repository
 
     async def execute(
         self, registration_id: UUID, competition_id: UUID, variants_count: int
     ) -> AssignSeatResult | None:
         # 1. Check if already assigned (idempotent)
-        existing = await self.seat_repo.get_by_registration(registration_id)
-        if existing:
-            room = await self.room_repo.get_by_id(existing.room_id)
+        found = await self.seat_repo.get_with_room_name(registration_id)
+        if found:
+            existing, room_name = found
             return AssignSeatResult(
                 seat_assignment_id=existing.id,
                 room_id=existing.room_id,
-                room_name=room.name if room else "?",
+                room_name=room_name or "?",
                 seat_number=existing.seat_number,
                 variant_number=existing.variant_number,
             )
@@ -67,52 +98,19 @@ class AssignSeatUseCase:
             return None  # No rooms configured, skip seating
 
         # 3. Get participant's institution
-        registration = await self.registration_repo.get_by_id(registration_id)
-        if not registration:
+        found = await self.registration_repo.get_with_institution(registration_id)
+        if not found:
             raise ValueError("Регистрация не найдена")
+        _, institution_id = found
 
-        participant = await self.participant_repo.get_by_id(registration.participant_id)
-        if not participant:
-            raise ValueError("Участник не найден")
-
-        institution_id = participant.institution_id
-
-        # 4. Evaluate each room
-        best_room = None
-        best_same_inst = float('inf')
-        best_free_seats = -1
-
-        for room in rooms:
-            occupied = await self.seat_repo.count_by_room(room.id)
-            free_seats = room.capacity - occupied
-
-            if free_seats <= 0:
-                continue  # Room full
-
-            if institution_id:
-                same_inst = await self.seat_repo.count_by_room_and_institution(
-                    room.id, institution_id
-                )
-            else:
-                same_inst = 0
-
-            # Pick room with fewest same-institution (tie-break: most free seats)
-            if (same_inst < best_same_inst) or (
-                same_inst == best_same_inst and free_seats > best_free_seats
-            ):
-                best_room = room
-                best_same_inst = same_inst
-                best_free_seats = free_seats
-
+        # 4. Evaluate each room from one aggregate over its assignments
+        stats = await self.seat_repo.get_room_stats(competition_id, institution_id)
+        best_room = _pick_room(rooms, stats)
         if not best_room:
             raise ValueError("Нет свободных мест ни в одной аудитории")
 
         # 5. Find next available seat number
-        room_assignments = await self.seat_repo.get_by_room(best_room.id)
-        taken_seats = {a.seat_number for a in room_assignments}
-        seat_number = 1
-        while seat_number in taken_seats:
-            seat_number += 1
+        seat_number = await self.seat_repo.next_free_seat(best_room.id)
 
         # 6. Assign variant
         variant_number = (seat_number % variants_count) + 1
@@ -133,3 +131,76 @@ class AssignSeatUseCase:
             seat_number=seat_number,
             variant_number=variant_number,
         )
+
+    async def assign_all(
+        self, competition_id: UUID, variants_count: int
+    ) -> List[AssignSeatResult]:
+        """Seat every active registration of a competition that has no seat.
+
+        Applies the same room choice as ``execute`` to each registration in
+        turn, but over occupancy loaded once and kept in memory, and writes
+        all assignments in one batch. Registrations that no longer fit are
+        left unseated.
+
+        Returns:
+            Assignments made, in registration order
+        """
+        rooms = await self.room_repo.get_by_competition(competition_id)
+        if not rooms:
+            return []
+
+        pending = await self.registration_repo.get_unseated_with_institution(competition_id)
+        if not pending:
+            return []
+
+        occupied: Counter[UUID] = Counter()
+        institutions: Dict[UUID, Counter[UUID | None]] = defaultdict(Counter)
+        taken: Dict[UUID, set[int]] = defaultdict(set)
+        for room_id, seat_number, institution_id in await self.seat_repo.get_occupancy(competition_id):
+            occupied[room_id] += 1
+            institutions[room_id][institution_id] += 1
+            taken[room_id].add(seat_number)
+
+        # Seats are only ever added, so each room's search resumes where it stopped
+        next_seat: Dict[UUID, int] = defaultdict(lambda: 1)
+
+        assignments = []
+        results = []
+        for registration_id, institution_id in pending:
+            stats = {
+                room.id: (
+                    occupied[room.id],
+                    institutions[room.id][institution_id] if institution_id else 0,
+                )
+                for room in rooms
+            }
+            room = _pick_room(rooms, stats)
+            if not room:
+                break  # Every room is full
+
+            seat_number = next_seat[room.id]
+            while seat_number in taken[room.id]:
+                seat_number += 1
+            next_seat[room.id] = seat_number + 1
+
+            occupied[room.id] += 1
+            institutions[room.id][institution_id] += 1
+            taken[room.id].add(seat_number)
+
+            assignment = SeatAssignment(
+                registration_id=registration_id,
+                room_id=room.id,
+                seat_number=seat_number,
+                variant_number=(seat_number % variants_count) + 1,
+            )
+            assignments.append(assignment)
+            results.append(AssignSeatResult(
+                seat_assignment_id=assignment.id,
+                room_id=room.id,
+                room_name=room.name,
+                seat_number=seat_number,
+                variant_number=assignment.variant_number,
+            ))
+
+        await self.seat_repo.bulk_create(assignments)
+        return results
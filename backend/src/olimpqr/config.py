@@ -26,9 +26,15 @@ class Settings(BaseSettings):
     hmac_secret_key: str = Field(..., description="Secret key for HMAC token hashing")
     jwt_algorithm: str = Field(default="HS256", description="JWT signing algorithm")
     jwt_expire_minutes: int = Field(default=1440, description="JWT token expiration in minutes (24 hours)")
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31, description="bcrypt cost factor for new password hashes")
 
     # Database
     database_url: str = Field(..., description="PostgreSQL connection URL")
+    database_pool_size: int = Field(default=5, description="Connections kept open per process")
+    database_max_overflow: int = Field(default=10, description="Extra connections allowed above the pool size")
+    database_statement_cache_size: int = Field(
+        default=500, ge=0, description="Prepared statements kept per asyncpg connection (0 disables)"
+    )
 
     # Redis
     redis_url: str = Field(..., description="Redis connection URL")
@@ -8,7 +8,7 @@ from ..value_objects import SheetKind
 from ..value_objects.token import TokenHash
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerSheet:
     """Answer sheet entity - represents a physical answer sheet with QR token.
 
@@ -7,7 +7,7 @@ from uuid import UUID, uuid4
 from ..value_objects import AttemptStatus, TokenHash
 
 
-@dataclass
+@dataclass(slots=True)
 class Attempt:
     """Attempt entity - represents an answer sheet.
 
@@ -6,7 +6,7 @@ from typing import Any, Dict
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLog:
     """Audit log entity - tracks all important system actions.
 
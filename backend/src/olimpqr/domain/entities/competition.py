@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from uuid import UUID, uuid4
@@ -9,7 +10,7 @@ from uuid import UUID, uuid4
 from ..value_objects import CompetitionStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Competition:
     """Competition entity.
 
@@ -39,12 +40,36 @@ class Competition:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     def __post_init__(self):
+        self.validate()
+
+    def validate(self, changed: Collection[str] | None = None):
+        """Check invariants, optionally only those touching changed fields.
+
+        Args:
+            changed: Names of fields that changed; None checks everything
+        """
+        if changed is None or "name" in changed:
+            self._validate_name()
+        if changed is None or "registration_start" in changed or "registration_end" in changed:
+            self._validate_dates()
+        if changed is None or "variants_count" in changed:
+            self._validate_variants()
+        if changed is None or "max_score" in changed:
+            self._validate_score()
+
+    def _validate_name(self):
         if not self.name or len(self.name.strip()) < 3:
             raise ValueError("Название олимпиады должно быть не менее 3 символов")
+
+    def _validate_dates(self):
         if self.registration_start >= self.registration_end:
             raise ValueError("Начало регистрации должно быть раньше окончания")
+
+    def _validate_variants(self):
         if self.variants_count < 1:
             raise ValueError("Должен быть хотя бы один вариант")
+
+    def _validate_score(self):
         if self.max_score < 1:
             raise ValueError("Максимальный балл должен быть положительным")
 
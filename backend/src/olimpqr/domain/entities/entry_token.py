@@ -7,7 +7,7 @@ from uuid import UUID, uuid4
 from ..value_objects import TokenHash
 
 
-@dataclass
+@dataclass(slots=True)
 class EntryToken:
     """Entry token entity - for admission QR codes.
 
@@ -65,7 +65,14 @@ class EntryToken:
     @property
     def is_expired(self) -> bool:
         """Check if token has expired."""
-        return datetime.utcnow() > self.expires_at
+        return self.is_expired_at(datetime.utcnow())
+
+    def is_expired_at(self, now: datetime) -> bool:
+        """Check if token has expired as of a given moment.
+
+        Lets a batch judge all its tokens against one clock reading.
+        """
+        return now > self.expires_at
 
     @property
     def is_used(self) -> bool:
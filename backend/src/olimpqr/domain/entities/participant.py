@@ -6,7 +6,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Participant:
     """Participant entity - extends User with participant-specific data.
 
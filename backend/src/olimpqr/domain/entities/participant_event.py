@@ -7,7 +7,7 @@ from uuid import UUID, uuid4
 from ..value_objects import EventType
 
 
-@dataclass
+@dataclass(slots=True)
 class ParticipantEvent:
     """Participant event entity - records events during competition.
 
@@ -7,7 +7,7 @@ from uuid import UUID, uuid4
 from ..value_objects import RegistrationStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Registration:
     """Registration entity - links participant to competition.
 
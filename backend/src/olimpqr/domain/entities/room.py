@@ -5,7 +5,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     """Room entity - competition room for seating participants.
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Scan:
     """Scan entity - represents an uploaded scan of an answer sheet.
 
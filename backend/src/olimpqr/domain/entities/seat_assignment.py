@@ -5,7 +5,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class SeatAssignment:
     """Seat assignment entity - assigns a participant to a room and seat.
 
@@ -7,7 +7,7 @@ from uuid import UUID, uuid4
 from ..value_objects import UserRole
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User entity representing system users (all roles).
 
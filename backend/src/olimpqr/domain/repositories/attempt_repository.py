@@ -11,6 +11,11 @@ from ..entities import Attempt
 class AttemptRepository(BaseRepository[Attempt]):
     """Repository interface for Attempt entity."""
 
+    @abstractmethod
+    async def bulk_create(self, entities: List[Attempt]) -> List[Attempt]:
+        """Create many entities in one round trip."""
+        pass
+
     @abstractmethod
     async def get_by_sheet_token_hash(self, sheet_token_hash: str) -> Attempt | None:
         """Get attempt by sheet token hash."""
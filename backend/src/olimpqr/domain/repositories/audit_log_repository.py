@@ -11,6 +11,11 @@ from ..entities import AuditLog
 class AuditLogRepository(BaseRepository[AuditLog]):
     """Repository interface for AuditLog entity."""
 
+    @abstractmethod
+    async def bulk_create(self, entities: List[AuditLog]) -> List[AuditLog]:
+        """Create many entities in one round trip."""
+        pass
+
     @abstractmethod
     async def get_by_entity(
         self, entity_type: str, entity_id: UUID, skip: int = 0, limit: int = 100
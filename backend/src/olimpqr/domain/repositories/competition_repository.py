@@ -1,7 +1,7 @@
 """Competition repository interface."""
 
 from abc import abstractmethod
-from typing import List
+from typing import Any, Dict, List
 from uuid import UUID
 
 from .base import BaseRepository
@@ -12,6 +12,24 @@ from ..value_objects import CompetitionStatus
 class CompetitionRepository(BaseRepository[Competition]):
     """Repository interface for Competition entity."""
 
+    @abstractmethod
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Competition]:
+        """Get competitions by IDs, keyed by ID."""
+        pass
+
+    @abstractmethod
+    async def patch(self, entity_id: UUID, fields: Dict[str, Any]) -> Competition | None:
+        """Update only the given fields of a competition.
+
+        Args:
+            entity_id: Competition ID
+            fields: New values keyed by field name
+
+        Returns:
+            Updated competition, or None if it does not exist
+        """
+        pass
+
     @abstractmethod
     async def get_by_status(self, status: CompetitionStatus, skip: int = 0, limit: int = 100) -> List[Competition]:
         """Get competitions by status."""
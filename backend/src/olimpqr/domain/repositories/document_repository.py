@@ -1,7 +1,7 @@
 """Document repository interface."""
 
 from abc import abstractmethod
-from typing import List
+from typing import List, Set
 from uuid import UUID
 
 from .base import BaseRepository
@@ -15,3 +15,13 @@ class DocumentRepository(BaseRepository[Document]):
     async def get_by_participant(self, participant_id: UUID) -> List[Document]:
         """Get all documents for a participant."""
         pass
+
+    @abstractmethod
+    async def exists_by_participant(self, participant_id: UUID) -> bool:
+        """Check whether a participant has at least one document."""
+        pass
+
+    @abstractmethod
+    async def get_participants_with_documents(self, participant_ids: List[UUID]) -> Set[UUID]:
+        """Get which of the given participants have at least one document."""
+        pass
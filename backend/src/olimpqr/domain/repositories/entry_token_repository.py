@@ -1,6 +1,7 @@
 """Entry token repository interface."""
 
 from abc import abstractmethod
+from typing import Dict, List
 from uuid import UUID
 
 from .base import BaseRepository
@@ -15,6 +16,11 @@ class EntryTokenRepository(BaseRepository[EntryToken]):
         """Get entry token by token hash."""
         pass
 
+    @abstractmethod
+    async def get_by_token_hashes(self, token_hashes: List[str]) -> Dict[str, EntryToken]:
+        """Get entry tokens by token hashes, keyed by hash."""
+        pass
+
     @abstractmethod
     async def get_by_registration(self, registration_id: UUID) -> EntryToken | None:
         """Get entry token by registration ID."""
@@ -1,7 +1,8 @@
 """Institution repository interface."""
 
 from abc import abstractmethod
-from typing import List
+from typing import Dict, List
+from uuid import UUID
 
 from .base import BaseRepository
 from ..entities import Institution
@@ -10,6 +11,20 @@ from ..entities import Institution
 class InstitutionRepository(BaseRepository[Institution]):
     """Repository interface for Institution entity."""
 
+    @abstractmethod
+    async def create_many(self, institutions: List[Institution]) -> List[Institution]:
+        """Insert institutions, skipping names that already exist.
+
+        Returns:
+            The institutions that were actually inserted
+        """
+        pass
+
+    @abstractmethod
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Institution]:
+        """Get institutions by IDs, keyed by ID."""
+        pass
+
     @abstractmethod
     async def search(self, query: str, limit: int = 20) -> List[Institution]:
         """Search institutions by name."""
@@ -1,6 +1,7 @@
 """Participant repository interface."""
 
 from abc import abstractmethod
+from typing import Dict, List
 from uuid import UUID
 
 from .base import BaseRepository
@@ -10,6 +11,11 @@ from ..entities import Participant
 class ParticipantRepository(BaseRepository[Participant]):
     """Repository interface for Participant entity."""
 
+    @abstractmethod
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Participant]:
+        """Get participants by IDs, keyed by ID."""
+        pass
+
     @abstractmethod
     async def get_by_user_id(self, user_id: UUID) -> Participant | None:
         """Get participant by user ID."""
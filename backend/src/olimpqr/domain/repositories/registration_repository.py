@@ -1,16 +1,61 @@
 """Registration repository interface."""
 
 from abc import abstractmethod
-from typing import List
+from typing import Dict, List, Tuple
 from uuid import UUID
 
 from .base import BaseRepository
-from ..entities import Registration
+from ..entities import Registration, EntryToken
 
 
 class RegistrationRepository(BaseRepository[Registration]):
     """Repository interface for Registration entity."""
 
+    @abstractmethod
+    async def create_if_absent(self, entity: Registration) -> Registration | None:
+        """Create a registration unless the participant already has one.
+
+        Returns:
+            Created registration, or None if one exists for the same
+            participant and competition
+        """
+        pass
+
+    @abstractmethod
+    async def create_with_token(
+        self, registration: Registration, entry_token: EntryToken
+    ) -> Registration | None:
+        """Create a registration and its entry token together.
+
+        Returns:
+            Created registration, or None (and no token written) if one
+            exists for the same participant and competition
+        """
+        pass
+
+    @abstractmethod
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Registration]:
+        """Get registrations by IDs, keyed by ID."""
+        pass
+
+    @abstractmethod
+    async def get_with_institution(
+        self, registration_id: UUID
+    ) -> Tuple[Registration, UUID | None] | None:
+        """Get registration with its participant's institution ID in one query."""
+        pass
+
+    @abstractmethod
+    async def get_unseated_with_institution(
+        self, competition_id: UUID
+    ) -> List[Tuple[UUID, UUID | None]]:
+        """Get active registrations of a competition that have no seat yet.
+
+        Returns:
+            (registration ID, participant's institution ID) in registration order
+        """
+        pass
+
     @abstractmethod
     async def get_by_participant_and_competition(
         self, participant_id: UUID, competition_id: UUID
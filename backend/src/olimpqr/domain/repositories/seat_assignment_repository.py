@@ -1,7 +1,7 @@
 """Seat assignment repository interface."""
 
 from abc import abstractmethod
-from typing import List
+from typing import Dict, List, Tuple
 from uuid import UUID
 
 from .base import BaseRepository
@@ -11,22 +11,52 @@ from ..entities import SeatAssignment
 class SeatAssignmentRepository(BaseRepository[SeatAssignment]):
     """Repository interface for SeatAssignment entity."""
 
+    @abstractmethod
+    async def bulk_create(self, entities: List[SeatAssignment]) -> List[SeatAssignment]:
+        """Create many seat assignments in one batch."""
+        pass
+
     @abstractmethod
     async def get_by_registration(self, registration_id: UUID) -> SeatAssignment | None:
         """Get seat assignment by registration ID."""
         pass
 
+    @abstractmethod
+    async def get_with_room_name(
+        self, registration_id: UUID
+    ) -> Tuple[SeatAssignment, str | None] | None:
+        """Get seat assignment by registration ID with its room name in one query."""
+        pass
+
     @abstractmethod
     async def get_by_room(self, room_id: UUID) -> List[SeatAssignment]:
         """Get all seat assignments for a room."""
         pass
 
     @abstractmethod
-    async def count_by_room(self, room_id: UUID) -> int:
-        """Count occupied seats in a room."""
+    async def next_free_seat(self, room_id: UUID) -> int:
+        """Get the smallest seat number not yet taken in a room."""
+        pass
+
+    @abstractmethod
+    async def get_room_stats(
+        self, competition_id: UUID, institution_id: UUID | None
+    ) -> Dict[UUID, Tuple[int, int]]:
+        """Count occupants per room of a competition in one query.
+
+        Returns:
+            (occupied seats, occupants from institution_id) keyed by room
+            ID; rooms with no assignments are omitted
+        """
         pass
 
     @abstractmethod
-    async def count_by_room_and_institution(self, room_id: UUID, institution_id: UUID) -> int:
-        """Count participants from a given institution in a room."""
+    async def get_occupancy(
+        self, competition_id: UUID
+    ) -> List[Tuple[UUID, int, UUID | None]]:
+        """Get every taken seat of a competition.
+
+        Returns:
+            (room ID, seat number, occupant's institution ID) per assignment
+        """
         pass
@@ -4,13 +4,28 @@ from abc import abstractmethod
 from typing import List
 
 from .base import BaseRepository
-from ..entities import User
+from ..entities import Participant, User
 from ..value_objects import UserRole
 
 
 class UserRepository(BaseRepository[User]):
     """Repository interface for User entity."""
 
+    @abstractmethod
+    async def create_with_participant(self, user: User, participant: Participant) -> User:
+        """Create a user together with its participant profile.
+
+        Both rows are written in a single flush.
+
+        Args:
+            user: User to create
+            participant: Participant profile of that user
+
+        Returns:
+            Created user
+        """
+        pass
+
     @abstractmethod
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email address.
@@ -57,6 +57,37 @@ class QRService:
 
         return img_bytes.getvalue()
 
+    @classmethod
+    def generate_qr_matrix(
+        cls,
+        data: str,
+        error_correction: str = "H",
+        border: int = 4
+    ) -> list[list[bool]]:
+        """Generate the QR module matrix without rasterizing it.
+
+        Args:
+            data: Data to encode in QR code
+            error_correction: Error correction level (L, M, Q, H)
+            border: Border size in boxes
+
+        Returns:
+            Rows of modules, True for dark
+        """
+        if error_correction not in cls.ERROR_CORRECTION_LEVELS:
+            raise ValueError(f"Неверный уровень коррекции ошибок: {error_correction}")
+
+        qr = qrcode.QRCode(
+            version=None,  # Auto-size
+            error_correction=cls.ERROR_CORRECTION_LEVELS[error_correction],
+            border=border,
+        )
+
+        qr.add_data(data)
+        qr.make(fit=True)
+
+        return qr.get_matrix()
+
     @classmethod
     def generate_qr_code_base64(
         cls,
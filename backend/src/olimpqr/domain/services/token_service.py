@@ -36,6 +36,8 @@ class TokenService:
         if not secret_key or len(secret_key) < 32:
             raise ValueError("Секретный ключ должен быть не менее 32 символов")
         self.secret_key = secret_key.encode('utf-8')
+        # Keyed once; copying it skips re-deriving the padded key per token
+        self._hmac_prefix = hmac.new(self.secret_key, digestmod=hashlib.sha256)
 
     def generate_token(self, size_bytes: int = 32) -> Token:
         """Generate a new cryptographically secure token with HMAC hash.
@@ -91,6 +93,23 @@ class TokenService:
         """
         return self._compute_hash(raw_token)
 
+    def hash_tokens(self, raw_tokens: list[str]) -> list[TokenHash]:
+        """Compute HMAC-SHA256 hashes of many tokens.
+
+        Args:
+            raw_tokens: Raw token values
+
+        Returns:
+            TokenHash objects in the same order
+        """
+        prefix = self._hmac_prefix
+        hashes = []
+        for raw_token in raw_tokens:
+            h = prefix.copy()
+            h.update(raw_token.encode('utf-8'))
+            hashes.append(TokenHash(value=h.hexdigest()))
+        return hashes
+
     def _compute_hash(self, raw_token: str) -> TokenHash:
         """Compute HMAC-SHA256 hash of a token.
 
@@ -100,12 +119,9 @@ class TokenService:
         Returns:
             TokenHash object with hex digest
         """
-        # Compute HMAC-SHA256
-        h = hmac.new(
-            self.secret_key,
-            raw_token.encode('utf-8'),
-            hashlib.sha256
-        )
+        # Compute HMAC-SHA256 from the pre-keyed state
+        h = self._hmac_prefix.copy()
+        h.update(raw_token.encode('utf-8'))
 
         # Return hex digest (64 characters)
         return TokenHash(value=h.hexdigest())
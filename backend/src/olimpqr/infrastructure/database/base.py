@@ -1,8 +1,14 @@
 """SQLAlchemy base model."""
 
+from sqlalchemy import String
 from sqlalchemy.orm import DeclarativeBase
 
 
+# Hex HMAC digests: byte-wise "C" collation makes unique-index probes
+# memcmp instead of locale-aware strcoll (PostgreSQL only; SQLite has no "C")
+TokenHashString = String(64).with_variant(String(64, collation="C"), "postgresql")
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
     pass
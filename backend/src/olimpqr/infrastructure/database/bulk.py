@@ -0,0 +1,68 @@
+"""Bulk row insertion helpers."""
+
+import enum
+import json
+from typing import Any
+
+from sqlalchemy import JSON, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import Base
+
+# Below this many rows COPY setup costs more than it saves over executemany
+COPY_THRESHOLD = 100
+
+
+def _copy_value(column, value: Any) -> Any:
+    """Convert a Python value into what asyncpg's COPY encoder expects."""
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(column.type, JSON):
+        # SQLAlchemy registers the json codec with a str passthrough encoder
+        return json.dumps(value)
+    return value
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+) -> None:
+    """Insert many rows into the model's table in the current transaction.
+
+    Large batches on PostgreSQL go through ``COPY`` on the raw asyncpg
+    connection; smaller batches and other drivers use a single
+    executemany ``INSERT``.
+
+    Args:
+        session: Session whose connection and transaction are used
+        model: ORM model class of the target table
+        rows: Column values keyed by column name, all with the same keys
+    """
+    if not rows:
+        return
+
+    conn = await session.connection()
+    if len(rows) < COPY_THRESHOLD or conn.dialect.driver != "asyncpg":
+        await session.execute(insert(model), rows)
+        return
+
+    # COPY bypasses the unit of work, so pending objects it may reference
+    # (e.g. FK targets) must reach the database first
+    await session.flush()
+
+    table = model.__table__
+    columns = [table.c[name] for name in rows[0]]
+    records = [
+        tuple(_copy_value(column, row[column.name]) for column in columns)
+        for row in rows
+    ]
+
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=[column.name for column in columns],
+    )
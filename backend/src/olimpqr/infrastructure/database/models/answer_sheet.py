@@ -9,7 +9,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from olimpqr.domain.value_objects.sheet_kind import SheetKind
 
-from ..base import Base
+from ..base import Base, TokenHashString
 
 if TYPE_CHECKING:
     from .attempt import AttemptModel
@@ -32,7 +32,7 @@ class AnswerSheetModel(Base):
         index=True
     )
     sheet_token_hash: Mapped[str] = mapped_column(
-        String(64),
+        TokenHashString,
         nullable=False,
         unique=True,
         index=True
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from olimpqr.domain.value_objects.attempt_status import AttemptStatus
 
-from ..base import Base
+from ..base import Base, TokenHashString
 
 if TYPE_CHECKING:
     from .registration import RegistrationModel
@@ -21,8 +21,12 @@ class AttemptModel(Base):
 
     __tablename__ = "attempts"
     __table_args__ = (
-        Index("ix_attempts_registration_status", "registration_id", "status"),
-        Index("ix_attempts_sheet_token", "sheet_token_hash"),
+        Index(
+            "ix_attempts_registration_status",
+            "registration_id",
+            "status",
+            postgresql_include=["score_total", "confidence"],
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -32,15 +36,14 @@ class AttemptModel(Base):
     )
     registration_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("registrations.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     variant_number: Mapped[int] = mapped_column(
         Integer,
         nullable=False
     )
     sheet_token_hash: Mapped[str] = mapped_column(
-        String(64),
+        TokenHashString,
         nullable=False,
         unique=True,
         index=True
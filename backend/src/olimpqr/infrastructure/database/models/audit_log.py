@@ -30,22 +30,18 @@ class AuditLogModel(Base):
     )
     entity_type: Mapped[str] = mapped_column(
         String(100),
-        nullable=False,
-        index=True
+        nullable=False
     )
     entity_id: Mapped[uuid.UUID] = mapped_column(
-        nullable=False,
-        index=True
+        nullable=False
     )
     action: Mapped[str] = mapped_column(
         String(100),
-        nullable=False,
-        index=True
+        nullable=False
     )
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     ip_address: Mapped[Optional[str]] = mapped_column(
         String(45),
@@ -6,7 +6,7 @@ import uuid
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, DateTime, Enum as SQLEnum, ForeignKey, Integer, String
+from sqlalchemy import Date, DateTime, Enum as SQLEnum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from olimpqr.domain.value_objects.competition_status import CompetitionStatus
@@ -22,6 +22,10 @@ class CompetitionModel(Base):
     """Competition database model."""
 
     __tablename__ = "competitions"
+    __table_args__ = (
+        # Status-filtered lists ordered by date; also serves status-only lookups
+        Index("ix_competitions_status_date", "status", "date"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
@@ -65,8 +69,7 @@ class CompetitionModel(Base):
             values_callable=lambda e: [member.value for member in e],
         ),
         nullable=False,
-        default=CompetitionStatus.DRAFT,
-        index=True
+        default=CompetitionStatus.DRAFT
     )
     created_by: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"),
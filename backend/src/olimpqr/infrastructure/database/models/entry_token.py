@@ -4,10 +4,10 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ..base import Base
+from ..base import Base, TokenHashString
 
 if TYPE_CHECKING:
     from .registration import RegistrationModel
@@ -17,6 +17,14 @@ class EntryTokenModel(Base):
     """Entry token database model."""
 
     __tablename__ = "entry_tokens"
+    __table_args__ = (
+        # Only unused tokens are ever looked up by expiry
+        Index(
+            "ix_entry_tokens_expires_at_unused",
+            "expires_at",
+            postgresql_where=text("used_at IS NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
@@ -24,7 +32,7 @@ class EntryTokenModel(Base):
         index=True
     )
     token_hash: Mapped[str] = mapped_column(
-        String(64),
+        TokenHashString,
         nullable=False,
         unique=True,
         index=True
@@ -41,8 +49,7 @@ class EntryTokenModel(Base):
     )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime,
-        nullable=False,
-        index=True
+        nullable=False
     )
     used_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime,
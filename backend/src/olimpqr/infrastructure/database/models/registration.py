@@ -35,13 +35,11 @@ class RegistrationModel(Base):
     )
     participant_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("participants.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     competition_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("competitions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     status: Mapped[RegistrationStatus] = mapped_column(
         SQLEnum(
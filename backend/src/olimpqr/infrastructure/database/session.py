@@ -5,12 +5,28 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 
 from ...config import settings
 
+# SQLite (used by the integration tests) runs on a static pool without sizing
+_pool_options = (
+    {}
+    if settings.database_url.startswith("sqlite")
+    else {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        # asyncpg's default of 100 is below the number of distinct statements
+        # the app issues, so hot lookups kept getting evicted and re-prepared
+        "connect_args": {
+            "prepared_statement_cache_size": settings.database_statement_cache_size,
+        },
+    }
+)
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
     pool_pre_ping=True,
+    **_pool_options,
 )
 
 # Create session factory
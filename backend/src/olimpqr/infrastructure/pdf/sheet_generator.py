@@ -1,9 +1,11 @@
 """Answer sheet PDF generator with QR code."""
 
 from io import BytesIO
+from typing import BinaryIO
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase import pdfmetrics
@@ -60,6 +62,22 @@ def _register_fonts():
 # Register fonts on module load
 _register_fonts()
 
+# Image streams are already Flate-compressed; the extra ASCII85 pass is a
+# pure-Python encoder that dominated per-sheet render time and grew the file
+rl_config.useA85 = 0
+
+_LOGO_PATH = os.path.join(os.path.dirname(__file__), 'logo_black.png')
+_LOGO_IMAGE = None
+
+
+def _get_logo_image():
+    """Decode the logo PNG once per process and reuse it for every sheet."""
+    global _LOGO_IMAGE
+
+    if _LOGO_IMAGE is None and os.path.exists(_LOGO_PATH):
+        _LOGO_IMAGE = ImageReader(_LOGO_PATH)
+    return _LOGO_IMAGE
+
 
 class SheetGenerator:
     """Generator for answer sheet PDFs with QR codes."""
@@ -84,9 +102,29 @@ class SheetGenerator:
         Returns:
             PDF file as bytes
         """
-        # Create PDF in memory
         buffer = BytesIO()
-        c = canvas.Canvas(buffer, pagesize=A4)
+        self.write_answer_sheet(buffer, competition_name, variant_number, sheet_token)
+        return buffer.getvalue()
+
+    def write_answer_sheet(
+        self,
+        out: BinaryIO,
+        competition_name: str,
+        variant_number: int,
+        sheet_token: str
+    ):
+        """Render answer sheet PDF with QR code into a binary stream.
+
+        Lets callers upload the stream directly instead of copying the
+        PDF out into a separate bytes object first.
+
+        Args:
+            out: Writable binary stream, left positioned at the end
+            competition_name: Name of the competition
+            variant_number: Test variant number
+            sheet_token: Token for QR code (for linking scan to attempt)
+        """
+        c = canvas.Canvas(out, pagesize=A4)
 
         # Draw logo in top left corner
         self._draw_logo(c)
@@ -109,18 +147,11 @@ class SheetGenerator:
         # Finalize PDF
         c.save()
 
-        # Get PDF bytes
-        buffer.seek(0)
-        return buffer.getvalue()
-
     def _draw_logo(self, c: canvas.Canvas):
         """Draw logo in top left corner."""
-        import os
-        logo_path = os.path.join(os.path.dirname(__file__), 'logo_black.png')
-
-        if os.path.exists(logo_path):
-            try:
-                logo_image = ImageReader(logo_path)
+        try:
+            logo_image = _get_logo_image()
+            if logo_image is not None:
                 # Draw logo (30mm x 30mm in top left)
                 logo_x = 15*mm
                 logo_y = self.page_height - 35*mm
@@ -135,9 +166,9 @@ class SheetGenerator:
                     preserveAspectRatio=True,
                     mask='auto'
                 )
-            except Exception as e:
-                # If logo fails to load, continue without it
-                print(f"Warning: Could not load logo: {e}")
+        except Exception as e:
+            # If logo fails to load, continue without it
+            print(f"Warning: Could not load logo: {e}")
 
     def _draw_header(
         self,
@@ -160,31 +191,36 @@ class SheetGenerator:
 
     def _draw_qr_code(self, c: canvas.Canvas, sheet_token: str):
         """Draw QR code in top right corner."""
-        # Generate QR code
-        qr_bytes = self.qr_service.generate_qr_code(
-            sheet_token,
-            error_correction=settings.qr_error_correction,
-            box_size=8,
-            border=2
-        )
-
-        # Save QR to temp buffer and wrap with ImageReader
-        qr_buffer = BytesIO(qr_bytes)
-        qr_image = ImageReader(qr_buffer)
-
         # Draw QR code (40mm x 40mm in top right)
         qr_x = self.page_width - 50*mm
         qr_y = self.page_height - 50*mm
         qr_size = 40*mm
 
-        c.drawImage(
-            qr_image,
-            qr_x,
-            qr_y,
-            width=qr_size,
-            height=qr_size,
-            preserveAspectRatio=True
+        # Modules are drawn as vector rectangles: no PNG encode/decode and
+        # no image stream to compress, and edges stay sharp at any DPI
+        matrix = self.qr_service.generate_qr_matrix(
+            sheet_token,
+            error_correction=settings.qr_error_correction,
+            border=2
         )
+        module = qr_size / len(matrix)
+
+        path = c.beginPath()
+        for row_index, row in enumerate(matrix):
+            y = qr_y + qr_size - (row_index + 1) * module
+            col = 0
+            while col < len(row):
+                if not row[col]:
+                    col += 1
+                    continue
+                # One rectangle per horizontal run of dark modules
+                start = col
+                while col < len(row) and row[col]:
+                    col += 1
+                path.rect(qr_x + start * module, y, (col - start) * module, module)
+
+        c.setFillColor(colors.black)
+        c.drawPath(path, stroke=0, fill=1)
 
         # Draw label
         c.setFont("Helvetica", 8)
@@ -14,6 +14,8 @@ from .seat_assignment_repository_impl import SeatAssignmentRepositoryImpl
 from .document_repository_impl import DocumentRepositoryImpl
 from .participant_event_repository_impl import ParticipantEventRepositoryImpl
 from .answer_sheet_repository_impl import AnswerSheetRepositoryImpl
+from .cached_competition_repository import CachedCompetitionRepository
+from .cached_institution_repository import CachedInstitutionRepository
 
 __all__ = [
     "UserRepositoryImpl",
@@ -30,4 +32,6 @@ __all__ = [
     "DocumentRepositoryImpl",
     "ParticipantEventRepositoryImpl",
     "AnswerSheetRepositoryImpl",
+    "CachedCompetitionRepository",
+    "CachedInstitutionRepository",
 ]
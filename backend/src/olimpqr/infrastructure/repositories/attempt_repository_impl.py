@@ -8,6 +8,7 @@ from typing import List
 from ...domain.entities import Attempt
 from ...domain.repositories import AttemptRepository
 from ...domain.value_objects import TokenHash
+from ..database.bulk import bulk_insert
 from ..database.models import AttemptModel, RegistrationModel
 
 
@@ -35,6 +36,25 @@ class AttemptRepositoryImpl(AttemptRepository):
         await self.session.flush()
         return entity
 
+    async def bulk_create(self, entities: List[Attempt]) -> List[Attempt]:
+        """Create many attempts, via COPY for large batches."""
+        await bulk_insert(self.session, AttemptModel, [
+            {
+                "id": entity.id,
+                "registration_id": entity.registration_id,
+                "variant_number": entity.variant_number,
+                "sheet_token_hash": entity.sheet_token_hash.value,
+                "status": entity.status,
+                "score_total": entity.score_total,
+                "confidence": entity.confidence,
+                "pdf_file_path": entity.pdf_file_path,
+                "created_at": entity.created_at,
+                "updated_at": entity.updated_at,
+            }
+            for entity in entities
+        ])
+        return entities
+
     async def get_by_id(self, entity_id: UUID) -> Attempt | None:
         """Get attempt by ID."""
         result = await self.session.execute(
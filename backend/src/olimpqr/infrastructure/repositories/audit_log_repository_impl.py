@@ -7,6 +7,7 @@ from typing import List
 
 from ...domain.entities import AuditLog
 from ...domain.repositories import AuditLogRepository
+from ..database.bulk import bulk_insert
 from ..database.models import AuditLogModel
 
 
@@ -32,6 +33,23 @@ class AuditLogRepositoryImpl(AuditLogRepository):
         await self.session.flush()
         return entity
 
+    async def bulk_create(self, entities: List[AuditLog]) -> List[AuditLog]:
+        """Create many audit log entries, via COPY for large batches."""
+        await bulk_insert(self.session, AuditLogModel, [
+            {
+                "id": entity.id,
+                "entity_type": entity.entity_type,
+                "entity_id": entity.entity_id,
+                "action": entity.action,
+                "user_id": entity.user_id,
+                "ip_address": entity.ip_address,
+                "details": entity.details,
+                "timestamp": entity.timestamp,
+            }
+            for entity in entities
+        ])
+        return entities
+
     async def get_by_id(self, entity_id: UUID) -> AuditLog | None:
         """Get audit log by ID."""
         result = await self.session.execute(
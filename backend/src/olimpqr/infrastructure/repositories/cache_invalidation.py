@@ -0,0 +1,30 @@
+"""Drop read-through cache entries once the change that staled them commits."""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_PENDING_KEY = "cache_invalidations"
+
+
+def invalidate_after_commit(session: AsyncSession, cache: dict, key: Any) -> None:
+    """Drop cache[key] when the session's transaction commits.
+
+    Dropping it before the commit would let a concurrent request reload
+    the old row and cache it again for a full TTL. On rollback nothing
+    changed, so the pending drops are discarded.
+    """
+    session.info.setdefault(_PENDING_KEY, []).append((cache, key))
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_committed(session: Session) -> None:
+    for cache, key in session.info.pop(_PENDING_KEY, ()):
+        cache.pop(key, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,96 @@
+"""Read-through cache for competitions on hot paths."""
+
+import copy
+import time
+from uuid import UUID
+from typing import Any, Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...domain.entities import Competition
+from ...domain.repositories import CompetitionRepository
+from ...domain.value_objects import CompetitionStatus
+from .cache_invalidation import invalidate_after_commit
+
+# Short enough that status changes made by another worker show up quickly
+COMPETITION_CACHE_TTL = 10.0
+COMPETITION_CACHE_MAXSIZE = 512
+
+# Process-wide: repositories are built per request, the cache outlives them
+_cache: dict[UUID, tuple[float, Competition]] = {}
+
+
+def invalidate_competition(session: AsyncSession, competition_id: UUID) -> None:
+    """Drop a competition from the cache once the session commits its change."""
+    invalidate_after_commit(session, _cache, competition_id)
+
+
+class CachedCompetitionRepository(CompetitionRepository):
+    """CompetitionRepository that caches get_by_id results with a TTL.
+
+    Admission looks up the same competition for every participant admitted,
+    so a burst of admissions costs one SELECT per TTL instead of one each.
+    Callers get a copy, so mutating a returned entity never leaks into
+    the cache.
+    """
+
+    def __init__(self, inner: CompetitionRepository):
+        self.inner = inner
+
+    async def get_by_id(self, entity_id: UUID) -> Competition | None:
+        """Get competition by ID, from the cache when fresh."""
+        now = time.monotonic()
+        cached = _cache.get(entity_id)
+        if cached and cached[0] > now:
+            return copy.copy(cached[1])
+
+        competition = await self.inner.get_by_id(entity_id)
+        if competition is None:
+            return None
+
+        if len(_cache) >= COMPETITION_CACHE_MAXSIZE:
+            _cache.clear()
+        _cache[entity_id] = (now + COMPETITION_CACHE_TTL, copy.copy(competition))
+        return competition
+
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Competition]:
+        """Get competitions by IDs, querying only those not cached."""
+        now = time.monotonic()
+        found: Dict[UUID, Competition] = {}
+        missing = []
+        for entity_id in set(entity_ids):
+            cached = _cache.get(entity_id)
+            if cached and cached[0] > now:
+                found[entity_id] = copy.copy(cached[1])
+            else:
+                missing.append(entity_id)
+
+        if missing:
+            fetched = await self.inner.get_many_by_ids(missing)
+            if len(_cache) + len(fetched) > COMPETITION_CACHE_MAXSIZE:
+                _cache.clear()
+            for entity_id, competition in fetched.items():
+                _cache[entity_id] = (now + COMPETITION_CACHE_TTL, copy.copy(competition))
+            found.update(fetched)
+        return found
+
+    async def create(self, entity: Competition) -> Competition:
+        return await self.inner.create(entity)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Competition]:
+        return await self.inner.get_all(skip, limit)
+
+    async def update(self, entity: Competition) -> Competition:
+        return await self.inner.update(entity)
+
+    async def patch(self, entity_id: UUID, fields: Dict[str, Any]) -> Competition | None:
+        return await self.inner.patch(entity_id, fields)
+
+    async def delete(self, entity_id: UUID) -> bool:
+        return await self.inner.delete(entity_id)
+
+    async def get_by_status(self, status: CompetitionStatus, skip: int = 0, limit: int = 100) -> List[Competition]:
+        return await self.inner.get_by_status(status, skip, limit)
+
+    async def get_published(self, skip: int = 0, limit: int = 100) -> List[Competition]:
+        return await self.inner.get_published(skip, limit)
@@ -0,0 +1,96 @@
+"""Read-through cache for institutions on hot paths."""
+
+import copy
+import time
+from uuid import UUID
+from typing import Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...domain.entities import Institution
+from ...domain.repositories import InstitutionRepository
+from .cache_invalidation import invalidate_after_commit
+
+# Invalidation only reaches this worker's cache; the TTL bounds how long
+# other workers keep serving an institution after it was changed
+INSTITUTION_CACHE_TTL = 10.0
+INSTITUTION_CACHE_MAXSIZE = 4096
+
+# Process-wide: repositories are built per request, the cache outlives them
+_cache: dict[UUID, tuple[float, Institution]] = {}
+
+
+def invalidate_institution(session: AsyncSession, institution_id: UUID) -> None:
+    """Drop an institution from the cache once the session commits its change."""
+    invalidate_after_commit(session, _cache, institution_id)
+
+
+class CachedInstitutionRepository(InstitutionRepository):
+    """InstitutionRepository that caches lookups by ID with a TTL.
+
+    Every entry scan resolves the participant's institution name, and a
+    few thousand institutions are shared by all participants, so admission
+    queries each institution at most once per TTL. Callers get
+    a copy, so mutating a returned entity never leaks into the cache.
+    """
+
+    def __init__(self, inner: InstitutionRepository):
+        self.inner = inner
+
+    async def get_by_id(self, entity_id: UUID) -> Institution | None:
+        """Get institution by ID, from the cache when fresh."""
+        now = time.monotonic()
+        cached = _cache.get(entity_id)
+        if cached and cached[0] > now:
+            return copy.copy(cached[1])
+
+        institution = await self.inner.get_by_id(entity_id)
+        if institution is None:
+            return None
+
+        if len(_cache) >= INSTITUTION_CACHE_MAXSIZE:
+            _cache.clear()
+        _cache[entity_id] = (now + INSTITUTION_CACHE_TTL, copy.copy(institution))
+        return institution
+
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Institution]:
+        """Get institutions by IDs, querying only those not cached."""
+        now = time.monotonic()
+        found: Dict[UUID, Institution] = {}
+        missing = []
+        for entity_id in set(entity_ids):
+            cached = _cache.get(entity_id)
+            if cached and cached[0] > now:
+                found[entity_id] = copy.copy(cached[1])
+            else:
+                missing.append(entity_id)
+
+        if missing:
+            fetched = await self.inner.get_many_by_ids(missing)
+            if len(_cache) + len(fetched) > INSTITUTION_CACHE_MAXSIZE:
+                _cache.clear()
+            for entity_id, institution in fetched.items():
+                _cache[entity_id] = (now + INSTITUTION_CACHE_TTL, copy.copy(institution))
+            found.update(fetched)
+        return found
+
+    async def create(self, entity: Institution) -> Institution:
+        return await self.inner.create(entity)
+
+    async def create_many(self, institutions: List[Institution]) -> List[Institution]:
+        return await self.inner.create_many(institutions)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Institution]:
+        return await self.inner.get_all(skip, limit)
+
+    async def update(self, entity: Institution) -> Institution:
+        return await self.inner.update(entity)
+
+    async def delete(self, entity_id: UUID) -> bool:
+        return await self.inner.delete(entity_id)
+
+    async def search(self, query: str, limit: int = 20) -> List[Institution]:
+        return await self.inner.search(query, limit)
+
+    async def get_by_name(self, name: str) -> Institution | None:
+        return await self.inner.get_by_name(name)
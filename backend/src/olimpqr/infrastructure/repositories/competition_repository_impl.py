@@ -1,14 +1,16 @@
 """Competition repository implementation."""
 
-from sqlalchemy import select
+from sqlalchemy import Row, select, update
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Any, Dict, List
 
 from ...domain.entities import Competition
 from ...domain.repositories import CompetitionRepository
 from ...domain.value_objects import CompetitionStatus
 from ..database.models import CompetitionModel
+from .cached_competition_repository import invalidate_competition
 
 
 class CompetitionRepositoryImpl(CompetitionRepository):
@@ -39,23 +41,30 @@ class CompetitionRepositoryImpl(CompetitionRepository):
     async def get_by_id(self, entity_id: UUID) -> Competition | None:
         """Get competition by ID."""
         result = await self.session.execute(
-            select(CompetitionModel).where(CompetitionModel.id == entity_id)
+            select(CompetitionModel)
+            .where(CompetitionModel.id == entity_id)
+            .options(raiseload("*"))
         )
         model = result.scalar_one_or_none()
         if not model:
             return None
         return self._to_entity(model)
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Competition]:
-        """Get all competitions with pagination."""
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Competition]:
+        """Get competitions by IDs, keyed by ID."""
+        if not entity_ids:
+            return {}
         result = await self.session.execute(
             select(CompetitionModel)
-            .offset(skip)
-            .limit(limit)
-            .order_by(CompetitionModel.date.desc())
+            .where(CompetitionModel.id.in_(set(entity_ids)))
+            .options(raiseload("*"))
         )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        return {model.id: self._to_entity(model) for model in result.scalars().all()}
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Competition]:
+        """Get all competitions with pagination."""
+        result = await self.session.execute(self._page(skip, limit))
+        return [self._to_entity(row) for row in result.all()]
 
     async def update(self, entity: Competition) -> Competition:
         """Update an existing competition."""
@@ -76,8 +85,23 @@ class CompetitionRepositoryImpl(CompetitionRepository):
         model.updated_at = entity.updated_at
 
         await self.session.flush()
+        invalidate_competition(self.session, entity.id)
         return entity
 
+    async def patch(self, entity_id: UUID, fields: Dict[str, Any]) -> Competition | None:
+        """Update only the given columns, returning the row in the same statement."""
+        result = await self.session.execute(
+            update(CompetitionModel)
+            .where(CompetitionModel.id == entity_id)
+            .values(**fields)
+            .returning(*CompetitionModel.__table__.columns)
+        )
+        row = result.first()
+        invalidate_competition(self.session, entity_id)
+        if not row:
+            return None
+        return self._to_entity(row)
+
     async def delete(self, entity_id: UUID) -> bool:
         """Delete a competition."""
         result = await self.session.execute(
@@ -89,34 +113,39 @@ class CompetitionRepositoryImpl(CompetitionRepository):
 
         await self.session.delete(model)
         await self.session.flush()
+        invalidate_competition(self.session, entity_id)
         return True
 
     async def get_by_status(self, status: CompetitionStatus, skip: int = 0, limit: int = 100) -> List[Competition]:
         """Get competitions by status."""
         result = await self.session.execute(
-            select(CompetitionModel)
-            .where(CompetitionModel.status == status)
-            .offset(skip)
-            .limit(limit)
-            .order_by(CompetitionModel.date.desc())
+            self._page(skip, limit).where(CompetitionModel.status == status)
         )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        return [self._to_entity(row) for row in result.all()]
 
     async def get_published(self, skip: int = 0, limit: int = 100) -> List[Competition]:
         """Get published competitions."""
         result = await self.session.execute(
-            select(CompetitionModel)
-            .where(CompetitionModel.status == CompetitionStatus.PUBLISHED)
+            self._page(skip, limit).where(CompetitionModel.status == CompetitionStatus.PUBLISHED)
+        )
+        return [self._to_entity(row) for row in result.all()]
+
+    @staticmethod
+    def _page(skip: int, limit: int):
+        """Select one page of competitions as plain column rows.
+
+        List endpoints only need the columns: skipping ORM hydration avoids
+        the identity map and the selectin load of each creator.
+        """
+        return (
+            select(*CompetitionModel.__table__.columns)
+            .order_by(CompetitionModel.date.desc())
             .offset(skip)
             .limit(limit)
-            .order_by(CompetitionModel.date.desc())
         )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
 
-    def _to_entity(self, model: CompetitionModel) -> Competition:
-        """Convert SQLAlchemy model to domain entity."""
+    def _to_entity(self, model: CompetitionModel | Row) -> Competition:
+        """Convert SQLAlchemy model or column row to domain entity."""
         return Competition(
             id=model.id,
             name=model.name,
@@ -1,9 +1,10 @@
 """Document repository implementation."""
 
-from sqlalchemy import select
+from sqlalchemy import literal, select
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import List, Set
 
 from ...domain.entities import Document
 from ...domain.repositories import DocumentRepository
@@ -71,10 +72,29 @@ class DocumentRepositoryImpl(DocumentRepository):
         result = await self.session.execute(
             select(DocumentModel)
             .where(DocumentModel.participant_id == participant_id)
+            .options(raiseload("*"))
             .order_by(DocumentModel.created_at.desc())
         )
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def exists_by_participant(self, participant_id: UUID) -> bool:
+        found = await self.session.scalar(
+            select(literal(1))
+            .where(DocumentModel.participant_id == participant_id)
+            .limit(1)
+        )
+        return found is not None
+
+    async def get_participants_with_documents(self, participant_ids: List[UUID]) -> Set[UUID]:
+        if not participant_ids:
+            return set()
+        result = await self.session.execute(
+            select(DocumentModel.participant_id)
+            .where(DocumentModel.participant_id.in_(set(participant_ids)))
+            .distinct()
+        )
+        return set(result.scalars().all())
+
     def _to_entity(self, model: DocumentModel) -> Document:
         return Document(
             id=model.id,
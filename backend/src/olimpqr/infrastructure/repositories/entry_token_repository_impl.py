@@ -1,9 +1,10 @@
 """Entry token repository implementation."""
 
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Dict, List
 
 from ...domain.entities import EntryToken
 from ...domain.repositories import EntryTokenRepository
@@ -84,13 +85,26 @@ class EntryTokenRepositoryImpl(EntryTokenRepository):
     async def get_by_token_hash(self, token_hash: str) -> EntryToken | None:
         """Get entry token by token hash."""
         result = await self.session.execute(
-            select(EntryTokenModel).where(EntryTokenModel.token_hash == token_hash)
+            select(EntryTokenModel)
+            .where(EntryTokenModel.token_hash == token_hash)
+            .options(raiseload("*"))
         )
         model = result.scalar_one_or_none()
         if not model:
             return None
         return self._to_entity(model)
 
+    async def get_by_token_hashes(self, token_hashes: List[str]) -> Dict[str, EntryToken]:
+        """Get entry tokens by token hashes, keyed by hash."""
+        if not token_hashes:
+            return {}
+        result = await self.session.execute(
+            select(EntryTokenModel)
+            .where(EntryTokenModel.token_hash.in_(set(token_hashes)))
+            .options(raiseload("*"))
+        )
+        return {model.token_hash: self._to_entity(model) for model in result.scalars().all()}
+
     async def get_by_registration(self, registration_id: UUID) -> EntryToken | None:
         """Get entry token by registration ID."""
         result = await self.session.execute(
@@ -1,13 +1,19 @@
 """Institution repository implementation."""
 
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Dict, List
 
 from ...domain.entities import Institution
 from ...domain.repositories import InstitutionRepository
 from ..database.models import InstitutionModel
+from .cached_institution_repository import invalidate_institution
+
+# 5 columns per row: stays well under PostgreSQL's 32767 bind parameters
+CREATE_MANY_CHUNK = 1000
 
 
 class InstitutionRepositoryImpl(InstitutionRepository):
@@ -28,15 +34,54 @@ class InstitutionRepositoryImpl(InstitutionRepository):
         await self.session.flush()
         return entity
 
+    async def create_many(self, institutions: List[Institution]) -> List[Institution]:
+        # Both dialects share the ON CONFLICT API; SQLite is used in tests
+        dialect = self.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+        created = []
+        for start in range(0, len(institutions), CREATE_MANY_CHUNK):
+            chunk = institutions[start:start + CREATE_MANY_CHUNK]
+            result = await self.session.execute(
+                insert(InstitutionModel)
+                .values([
+                    {
+                        "id": entity.id,
+                        "name": entity.name,
+                        "short_name": entity.short_name,
+                        "city": entity.city,
+                        "created_at": entity.created_at,
+                    }
+                    for entity in chunk
+                ])
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(InstitutionModel.id)
+            )
+            inserted = set(result.scalars().all())
+            created.extend(entity for entity in chunk if entity.id in inserted)
+        return created
+
     async def get_by_id(self, entity_id: UUID) -> Institution | None:
         result = await self.session.execute(
-            select(InstitutionModel).where(InstitutionModel.id == entity_id)
+            select(InstitutionModel)
+            .where(InstitutionModel.id == entity_id)
+            .options(raiseload("*"))
         )
         model = result.scalar_one_or_none()
         if not model:
             return None
         return self._to_entity(model)
 
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Institution]:
+        if not entity_ids:
+            return {}
+        result = await self.session.execute(
+            select(InstitutionModel)
+            .where(InstitutionModel.id.in_(set(entity_ids)))
+            .options(raiseload("*"))
+        )
+        return {model.id: self._to_entity(model) for model in result.scalars().all()}
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Institution]:
         result = await self.session.execute(
             select(InstitutionModel)
@@ -56,6 +101,7 @@ class InstitutionRepositoryImpl(InstitutionRepository):
         model.short_name = entity.short_name
         model.city = entity.city
         await self.session.flush()
+        invalidate_institution(self.session, entity.id)
         return entity
 
     async def delete(self, entity_id: UUID) -> bool:
@@ -67,6 +113,7 @@ class InstitutionRepositoryImpl(InstitutionRepository):
             return False
         await self.session.delete(model)
         await self.session.flush()
+        invalidate_institution(self.session, entity_id)
         return True
 
     async def search(self, query: str, limit: int = 20) -> List[Institution]:
@@ -1,9 +1,10 @@
 """Participant repository implementation."""
 
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Dict, List
 
 from ...domain.entities import Participant
 from ...domain.repositories import ParticipantRepository
@@ -36,13 +37,26 @@ class ParticipantRepositoryImpl(ParticipantRepository):
     async def get_by_id(self, entity_id: UUID) -> Participant | None:
         """Get participant by ID."""
         result = await self.session.execute(
-            select(ParticipantModel).where(ParticipantModel.id == entity_id)
+            select(ParticipantModel)
+            .where(ParticipantModel.id == entity_id)
+            .options(raiseload("*"))
         )
         model = result.scalar_one_or_none()
         if not model:
             return None
         return self._to_entity(model)
 
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Participant]:
+        """Get participants by IDs, keyed by ID."""
+        if not entity_ids:
+            return {}
+        result = await self.session.execute(
+            select(ParticipantModel)
+            .where(ParticipantModel.id.in_(set(entity_ids)))
+            .options(raiseload("*"))
+        )
+        return {model.id: self._to_entity(model) for model in result.scalars().all()}
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Participant]:
         """Get all participants with pagination."""
         result = await self.session.execute(
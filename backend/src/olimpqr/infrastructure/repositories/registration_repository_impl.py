@@ -1,13 +1,21 @@
 """Registration repository implementation."""
 
-from sqlalchemy import select
+from sqlalchemy import insert as sa_insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Dict, List, Tuple
 
-from ...domain.entities import Registration
+from ...domain.entities import Registration, EntryToken
+from ...domain.value_objects import RegistrationStatus
 from ...domain.repositories import RegistrationRepository
-from ..database.models import RegistrationModel
+from ..database.models import (
+    RegistrationModel,
+    ParticipantModel,
+    EntryTokenModel,
+    SeatAssignmentModel,
+)
 
 
 class RegistrationRepositoryImpl(RegistrationRepository):
@@ -30,16 +38,146 @@ class RegistrationRepositoryImpl(RegistrationRepository):
         await self.session.flush()
         return entity
 
+    async def create_if_absent(self, entity: Registration) -> Registration | None:
+        """Insert a registration, relying on uq_participant_competition for duplicates."""
+        dialect = self.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+        result = await self.session.execute(
+            self._insert_if_absent(insert, entity).returning(RegistrationModel.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
+        return entity
+
+    async def create_with_token(
+        self, registration: Registration, entry_token: EntryToken
+    ) -> Registration | None:
+        """Insert a registration and its entry token in one statement.
+
+        The token INSERT selects from the registration INSERT's RETURNING,
+        so a conflicting registration writes neither row. SQLite has no
+        data-modifying CTEs and takes two statements instead.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            if await self.create_if_absent(registration) is None:
+                return None
+            self.session.add(EntryTokenModel(
+                id=entry_token.id,
+                token_hash=entry_token.token_hash.value,
+                raw_token=entry_token.raw_token,
+                registration_id=registration.id,
+                expires_at=entry_token.expires_at,
+                used_at=entry_token.used_at,
+                created_at=entry_token.created_at
+            ))
+            await self.session.flush()
+            return registration
+
+        ins_reg = (
+            self._insert_if_absent(postgresql.insert, registration)
+            .returning(RegistrationModel.id)
+            .cte("ins_reg")
+        )
+        token_values = {
+            "id": entry_token.id,
+            "token_hash": entry_token.token_hash.value,
+            "raw_token": entry_token.raw_token,
+            "expires_at": entry_token.expires_at,
+            "used_at": entry_token.used_at,
+            "created_at": entry_token.created_at,
+        }
+        columns = EntryTokenModel.__table__.c
+        result = await self.session.execute(
+            sa_insert(EntryTokenModel)
+            .from_select(
+                [*token_values, "registration_id"],
+                select(
+                    *(literal(value, columns[name].type) for name, value in token_values.items()),
+                    ins_reg.c.id,
+                ),
+            )
+            .returning(EntryTokenModel.registration_id)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
+        return registration
+
+    @staticmethod
+    def _insert_if_absent(insert, entity: Registration):
+        """Build an INSERT of the registration that skips duplicates."""
+        return (
+            insert(RegistrationModel)
+            .values(
+                id=entity.id,
+                participant_id=entity.participant_id,
+                competition_id=entity.competition_id,
+                status=entity.status,
+                created_at=entity.created_at,
+                updated_at=entity.updated_at,
+            )
+            .on_conflict_do_nothing(index_elements=["participant_id", "competition_id"])
+        )
+
     async def get_by_id(self, entity_id: UUID) -> Registration | None:
         """Get registration by ID."""
         result = await self.session.execute(
-            select(RegistrationModel).where(RegistrationModel.id == entity_id)
+            select(RegistrationModel)
+            .where(RegistrationModel.id == entity_id)
+            .options(raiseload("*"))
         )
         model = result.scalar_one_or_none()
         if not model:
             return None
         return self._to_entity(model)
 
+    async def get_many_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Registration]:
+        """Get registrations by IDs, keyed by ID."""
+        if not entity_ids:
+            return {}
+        result = await self.session.execute(
+            select(RegistrationModel)
+            .where(RegistrationModel.id.in_(set(entity_ids)))
+            .options(raiseload("*"))
+        )
+        return {model.id: self._to_entity(model) for model in result.scalars().all()}
+
+    async def get_with_institution(
+        self, registration_id: UUID
+    ) -> Tuple[Registration, UUID | None] | None:
+        """Get registration with its participant's institution ID in one query."""
+        result = await self.session.execute(
+            select(RegistrationModel, ParticipantModel.institution_id)
+            .join(ParticipantModel, RegistrationModel.participant_id == ParticipantModel.id)
+            .where(RegistrationModel.id == registration_id)
+            .options(raiseload("*"))
+        )
+        row = result.first()
+        if not row:
+            return None
+        model, institution_id = row
+        return self._to_entity(model), institution_id
+
+    async def get_unseated_with_institution(
+        self, competition_id: UUID
+    ) -> List[Tuple[UUID, UUID | None]]:
+        """Get active registrations of a competition that have no seat yet."""
+        result = await self.session.execute(
+            select(RegistrationModel.id, ParticipantModel.institution_id)
+            .join(ParticipantModel, RegistrationModel.participant_id == ParticipantModel.id)
+            .outerjoin(
+                SeatAssignmentModel,
+                SeatAssignmentModel.registration_id == RegistrationModel.id,
+            )
+            .where(
+                RegistrationModel.competition_id == competition_id,
+                RegistrationModel.status != RegistrationStatus.CANCELLED,
+                SeatAssignmentModel.id.is_(None),
+            )
+            .order_by(RegistrationModel.created_at.asc())
+        )
+        return [tuple(row) for row in result.all()]
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Registration]:
         """Get all registrations with pagination."""
         result = await self.session.execute(
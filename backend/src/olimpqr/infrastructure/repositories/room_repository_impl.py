@@ -1,6 +1,6 @@
 """Room repository implementation."""
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import List
@@ -67,14 +67,16 @@ class RoomRepositoryImpl(RoomRepository):
         return True
 
     async def get_by_competition(self, competition_id: UUID) -> List[Room]:
+        # Plain column rows: no identity map, no selectin load of the
+        # competition (and its creator) for every room
         result = await self.session.execute(
-            select(RoomModel)
+            select(*RoomModel.__table__.columns)
             .where(RoomModel.competition_id == competition_id)
             .order_by(RoomModel.name)
         )
-        return [self._to_entity(m) for m in result.scalars().all()]
+        return [self._to_entity(row) for row in result.all()]
 
-    def _to_entity(self, model: RoomModel) -> Room:
+    def _to_entity(self, model: RoomModel | Row) -> Room:
         return Room(
             id=model.id,
             competition_id=model.competition_id,
@@ -1,13 +1,15 @@
 """Seat assignment repository implementation."""
 
-from sqlalchemy import func, select
+from sqlalchemy import case, exists, func, literal, select
+from sqlalchemy.orm import aliased, raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Dict, List, Tuple
 
 from ...domain.entities import SeatAssignment
 from ...domain.repositories import SeatAssignmentRepository
-from ..database.models import SeatAssignmentModel, RegistrationModel, ParticipantModel
+from ..database.bulk import bulk_insert
+from ..database.models import SeatAssignmentModel, RegistrationModel, ParticipantModel, RoomModel
 
 
 class SeatAssignmentRepositoryImpl(SeatAssignmentRepository):
@@ -29,6 +31,20 @@ class SeatAssignmentRepositoryImpl(SeatAssignmentRepository):
         await self.session.flush()
         return entity
 
+    async def bulk_create(self, entities: List[SeatAssignment]) -> List[SeatAssignment]:
+        await bulk_insert(self.session, SeatAssignmentModel, [
+            {
+                "id": entity.id,
+                "registration_id": entity.registration_id,
+                "room_id": entity.room_id,
+                "seat_number": entity.seat_number,
+                "variant_number": entity.variant_number,
+                "created_at": entity.created_at,
+            }
+            for entity in entities
+        ])
+        return entities
+
     async def get_by_id(self, entity_id: UUID) -> SeatAssignment | None:
         result = await self.session.execute(
             select(SeatAssignmentModel).where(SeatAssignmentModel.id == entity_id)
@@ -78,6 +94,21 @@ class SeatAssignmentRepositoryImpl(SeatAssignmentRepository):
             return None
         return self._to_entity(model)
 
+    async def get_with_room_name(
+        self, registration_id: UUID
+    ) -> Tuple[SeatAssignment, str | None] | None:
+        result = await self.session.execute(
+            select(SeatAssignmentModel, RoomModel.name)
+            .outerjoin(RoomModel, SeatAssignmentModel.room_id == RoomModel.id)
+            .where(SeatAssignmentModel.registration_id == registration_id)
+            .options(raiseload("*"))
+        )
+        row = result.first()
+        if not row:
+            return None
+        model, room_name = row
+        return self._to_entity(model), room_name
+
     async def get_by_room(self, room_id: UUID) -> List[SeatAssignment]:
         result = await self.session.execute(
             select(SeatAssignmentModel)
@@ -86,24 +117,65 @@ class SeatAssignmentRepositoryImpl(SeatAssignmentRepository):
         )
         return [self._to_entity(m) for m in result.scalars().all()]
 
-    async def count_by_room(self, room_id: UUID) -> int:
+    async def next_free_seat(self, room_id: UUID) -> int:
+        # Seat 1 if free, otherwise the first taken seat whose successor is
+        # free; both probes walk the (room_id, seat_number) unique index
+        taken = aliased(SeatAssignmentModel)
+        seat_one_taken = exists().where(
+            SeatAssignmentModel.room_id == room_id,
+            SeatAssignmentModel.seat_number == 1,
+        )
+        first_gap = (
+            select(func.min(SeatAssignmentModel.seat_number + 1))
+            .where(
+                SeatAssignmentModel.room_id == room_id,
+                ~exists().where(
+                    taken.room_id == room_id,
+                    taken.seat_number == SeatAssignmentModel.seat_number + 1,
+                ),
+            )
+            .scalar_subquery()
+        )
         result = await self.session.execute(
-            select(func.count(SeatAssignmentModel.id))
-            .where(SeatAssignmentModel.room_id == room_id)
+            select(case((seat_one_taken, first_gap), else_=literal(1)))
         )
         return result.scalar_one()
 
-    async def count_by_room_and_institution(self, room_id: UUID, institution_id: UUID) -> int:
+    async def get_room_stats(
+        self, competition_id: UUID, institution_id: UUID | None
+    ) -> Dict[UUID, Tuple[int, int]]:
+        same_inst = (
+            func.count(SeatAssignmentModel.id).filter(
+                ParticipantModel.institution_id == institution_id
+            )
+            if institution_id
+            else literal(0)
+        )
         result = await self.session.execute(
-            select(func.count(SeatAssignmentModel.id))
+            select(SeatAssignmentModel.room_id, func.count(SeatAssignmentModel.id), same_inst)
+            .join(RoomModel, SeatAssignmentModel.room_id == RoomModel.id)
             .join(RegistrationModel, SeatAssignmentModel.registration_id == RegistrationModel.id)
             .join(ParticipantModel, RegistrationModel.participant_id == ParticipantModel.id)
-            .where(
-                SeatAssignmentModel.room_id == room_id,
-                ParticipantModel.institution_id == institution_id,
+            .where(RoomModel.competition_id == competition_id)
+            .group_by(SeatAssignmentModel.room_id)
+        )
+        return {room_id: (occupied, same) for room_id, occupied, same in result.all()}
+
+    async def get_occupancy(
+        self, competition_id: UUID
+    ) -> List[Tuple[UUID, int, UUID | None]]:
+        result = await self.session.execute(
+            select(
+                SeatAssignmentModel.room_id,
+                SeatAssignmentModel.seat_number,
+                ParticipantModel.institution_id,
             )
+            .join(RoomModel, SeatAssignmentModel.room_id == RoomModel.id)
+            .join(RegistrationModel, SeatAssignmentModel.registration_id == RegistrationModel.id)
+            .join(ParticipantModel, RegistrationModel.participant_id == ParticipantModel.id)
+            .where(RoomModel.competition_id == competition_id)
         )
-        return result.scalar_one()
+        return [tuple(row) for row in result.all()]
 
     def _to_entity(self, model: SeatAssignmentModel) -> SeatAssignment:
         return SeatAssignment(
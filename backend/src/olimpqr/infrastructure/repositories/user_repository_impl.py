@@ -5,10 +5,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import List
 
-from ...domain.entities import User
+from ...domain.entities import Participant, User
 from ...domain.repositories import UserRepository
 from ...domain.value_objects import UserRole
-from ..database.models import UserModel
+from ..database.models import ParticipantModel, UserModel
 
 
 class UserRepositoryImpl(UserRepository):
@@ -32,6 +32,33 @@ class UserRepositoryImpl(UserRepository):
         await self.session.flush()
         return entity
 
+    async def create_with_participant(self, user: User, participant: Participant) -> User:
+        """Create a user and its participant profile in one flush."""
+        user_model = UserModel(
+            id=user.id,
+            email=user.email,
+            password_hash=user.password_hash,
+            role=user.role,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        )
+        participant_model = ParticipantModel(
+            id=participant.id,
+            user_id=user.id,
+            full_name=participant.full_name,
+            school=participant.school,
+            grade=participant.grade,
+            institution_id=participant.institution_id,
+            dob=participant.dob,
+            created_at=participant.created_at,
+            updated_at=participant.updated_at
+        )
+        # The unit of work orders the users INSERT before participants
+        self.session.add_all([user_model, participant_model])
+        await self.session.flush()
+        return user
+
     async def get_by_id(self, entity_id: UUID) -> User | None:
         """Get user by ID."""
         result = await self.session.execute(
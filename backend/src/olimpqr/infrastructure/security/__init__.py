@@ -1,12 +1,23 @@
 """Security utilities - JWT, password hashing, rate limiting."""
 
-from .password import hash_password, verify_password
+from .password import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+    dummy_password_hash,
+    dummy_password_hash_async,
+)
 from .jwt import create_access_token, verify_access_token, JWTPayload
 from .rate_limiter import limiter
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
+    "dummy_password_hash",
+    "dummy_password_hash_async",
     "create_access_token",
     "verify_access_token",
     "JWTPayload",
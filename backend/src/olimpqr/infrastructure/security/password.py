@@ -1,7 +1,15 @@
 """Password hashing utilities using bcrypt."""
 
+import asyncio
+import functools
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+from ...config import settings
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
@@ -18,7 +26,7 @@ def hash_password(password: str) -> str:
     if not password:
         raise ValueError("Пароль не может быть пустым")
     pwd_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     hashed = bcrypt.hashpw(pwd_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -42,3 +50,59 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         )
     except (ValueError, TypeError):
         return False
+
+
+# bcrypt releases the GIL, so threads hash on every core without a process
+# pool's pickling; one per core caps how many logins compete for CPU at once
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="bcrypt",
+        )
+    return _executor
+
+
+def _reset_executor() -> None:
+    # Worker threads do not survive fork; let the child start its own pool
+    global _executor
+    _executor = None
+
+
+os.register_at_fork(after_in_child=_reset_executor)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bcrypt pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bcrypt pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), verify_password, plain_password, hashed_password
+    )
+
+
+@functools.cache
+def dummy_password_hash() -> str:
+    """Hash of a random password nobody knows, at the configured cost.
+
+    Checking against it when the email is unknown makes that login take
+    as long as a wrong password, so response time does not reveal which
+    emails exist. Computed on first use rather than at import, so
+    processes that never log anyone in skip the bcrypt cost.
+    """
+    return hash_password(secrets.token_urlsafe(16))
+
+
+async def dummy_password_hash_async() -> str:
+    """Get the dummy hash, computing it on the bcrypt pool the first time."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), dummy_password_hash)
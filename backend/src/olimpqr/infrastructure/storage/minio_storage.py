@@ -7,6 +7,9 @@ from minio.error import S3Error
 
 from ...config import settings
 
+# Buckets only need checking once per process, not on every instantiation
+_buckets_ready = False
+
 
 class MinIOStorage:
     """MinIO S3-compatible storage service."""
@@ -23,17 +26,25 @@ class MinIOStorage:
 
     def _ensure_buckets(self):
         """Ensure required buckets exist."""
+        global _buckets_ready
+
+        if _buckets_ready:
+            return
+
         buckets = [
             settings.minio_bucket_sheets,
             settings.minio_bucket_scans
         ]
+        ready = True
         for bucket in buckets:
             try:
                 if not self.client.bucket_exists(bucket):
                     self.client.make_bucket(bucket)
                     print(f"Created MinIO bucket: {bucket}")
             except S3Error as e:
+                ready = False
                 print(f"Error creating bucket {bucket}: {e}")
+        _buckets_ready = ready
 
     def upload_file(
         self,
@@ -58,8 +69,8 @@ class MinIOStorage:
         """
         # Convert bytes to BytesIO if needed
         if isinstance(data, bytes):
+            length = len(data)
             data = BytesIO(data)
-            length = len(data.getvalue())
         else:
             # For file-like objects, seek to end to get length
             current_pos = data.tell()
@@ -8,7 +8,10 @@ celery_app = Celery(
     "olimpqr",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend or settings.celery_broker_url,
-    include=["olimpqr.infrastructure.tasks.ocr_tasks"]
+    include=[
+        "olimpqr.infrastructure.tasks.ocr_tasks",
+        "olimpqr.infrastructure.tasks.sheet_tasks",
+    ]
 )
 
 # Configure Celery
@@ -21,4 +24,6 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=600,  # 10 minutes max
     worker_prefetch_multiplier=1,
+    # An admitter waits on each sheet: keep them out from behind OCR jobs
+    task_routes={"olimpqr.render_answer_sheet": {"queue": "sheets"}},
 )
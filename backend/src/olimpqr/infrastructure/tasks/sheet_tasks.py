@@ -0,0 +1,65 @@
+"""Celery tasks for answer sheet PDF generation."""
+
+import logging
+from io import BytesIO
+
+from .celery_app import celery_app
+from ..pdf import SheetGenerator
+from ..storage import MinIOStorage
+from ...config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="olimpqr.render_answer_sheet",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=5,
+)
+def render_answer_sheet(
+    self,
+    competition_name: str,
+    variant_number: int,
+    sheet_token: str,
+    object_name: str,
+) -> dict:
+    """Render an answer sheet PDF and upload it to MinIO.
+
+    Runs in the Celery worker so the CPU-bound rendering and the MinIO
+    upload stay off the API request path.
+
+    Args:
+        competition_name: Competition name printed on the sheet
+        variant_number: Variant number printed on the sheet
+        sheet_token: Raw sheet token encoded in the QR code
+        object_name: Target object name in the sheets bucket
+
+    Returns:
+        Dict with the uploaded object name
+    """
+    logger.info("Rendering answer sheet %s", object_name)
+    try:
+        # Upload straight from the render buffer, no intermediate bytes copy
+        pdf_stream = BytesIO()
+        SheetGenerator().write_answer_sheet(
+            pdf_stream,
+            competition_name=competition_name,
+            variant_number=variant_number,
+            sheet_token=sheet_token,
+        )
+        pdf_stream.seek(0)
+        MinIOStorage().upload_file(
+            bucket=settings.minio_bucket_sheets,
+            object_name=object_name,
+            data=pdf_stream,
+            content_type="application/pdf",
+        )
+    except Exception as exc:
+        logger.error("Answer sheet rendering failed for %s: %s", object_name, exc, exc_info=True)
+        try:
+            self.retry(exc=exc)
+        except self.MaxRetriesExceededError:
+            return {"object_name": object_name, "status": "failed", "message": str(exc)}
+
+    return {"object_name": object_name, "status": "uploaded"}
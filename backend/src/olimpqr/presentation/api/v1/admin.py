@@ -16,15 +16,15 @@ from ....infrastructure.repositories import (
     ScanRepositoryImpl,
     RegistrationRepositoryImpl,
     ParticipantRepositoryImpl,
-    EntryTokenRepositoryImpl,
 )
-from ....infrastructure.security import hash_password
+from ....infrastructure.security import hash_password_async
 from ....domain.entities import User
 from ....domain.value_objects import UserRole
 from ....domain.services import TokenService
 from ....application.use_cases.registration.register_for_competition import (
     RegisterForCompetitionUseCase,
 )
+from ....config import settings
 from ...schemas.admin_schemas import (
     CreateStaffRequest,
     UpdateUserRequest,
@@ -98,7 +98,7 @@ async def create_staff_user(
     user = User(
         id=uuid4(),
         email=body.email,
-        password_hash=hash_password(body.password),
+        password_hash=await hash_password_async(body.password),
         role=body.role,
     )
     user = await user_repo.create(user)
@@ -310,14 +310,12 @@ async def admin_register_participant(
     registration_repo = RegistrationRepositoryImpl(db)
     competition_repo = CompetitionRepositoryImpl(db)
     participant_repo = ParticipantRepositoryImpl(db)
-    entry_token_repo = EntryTokenRepositoryImpl(db)
-    token_service = TokenService()
+    token_service = TokenService(settings.hmac_secret_key)
 
     use_case = RegisterForCompetitionUseCase(
         registration_repository=registration_repo,
         competition_repository=competition_repo,
         participant_repository=participant_repo,
-        entry_token_repository=entry_token_repo,
         token_service=token_service,
     )
 
@@ -1,5 +1,7 @@
 """Admission API endpoints (Admitter role)."""
 
+import asyncio
+import logging
 from typing import Annotated
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
@@ -11,6 +13,8 @@ from ....infrastructure.repositories import (
     RegistrationRepositoryImpl,
     ParticipantRepositoryImpl,
     CompetitionRepositoryImpl,
+    CachedCompetitionRepository,
+    CachedInstitutionRepository,
     AttemptRepositoryImpl,
     AuditLogRepositoryImpl,
     AnswerSheetRepositoryImpl,
@@ -20,25 +24,34 @@ from ....infrastructure.repositories import (
     SeatAssignmentRepositoryImpl,
 )
 from ....infrastructure.storage import MinIOStorage
-from ....infrastructure.pdf import SheetGenerator
+from ....infrastructure.tasks.sheet_tasks import render_answer_sheet
 from ....domain.services import TokenService
 from ....domain.value_objects import UserRole
 from ....domain.entities import User
 from ....application.use_cases.admission import (
     VerifyEntryQRUseCase,
+    VerifyEntryQRResult,
     ApproveAdmissionUseCase,
 )
 from ...schemas.admission_schemas import (
     VerifyEntryQRRequest,
     VerifyEntryQRResponse,
+    VerifyEntryQRBatchRequest,
+    VerifyEntryQRBatchItemResponse,
+    VerifyEntryQRBatchResponse,
     ApproveAdmissionRequest,
     ApproveAdmissionResponse,
 )
 from ...dependencies import require_role
 from ....config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Backoff (seconds) while the worker is still rendering a fresh answer sheet
+SHEET_WAIT_DELAYS = (0.25, 0.5, 1.0, 2.0)
+
 
 @router.post("/verify", response_model=VerifyEntryQRResponse)
 async def verify_entry_qr(
@@ -57,26 +70,12 @@ async def verify_entry_qr(
             entry_token_repository=EntryTokenRepositoryImpl(db),
             registration_repository=RegistrationRepositoryImpl(db),
             participant_repository=ParticipantRepositoryImpl(db),
-            competition_repository=CompetitionRepositoryImpl(db),
-            institution_repository=InstitutionRepositoryImpl(db),
+            competition_repository=CachedCompetitionRepository(CompetitionRepositoryImpl(db)),
+            institution_repository=CachedInstitutionRepository(InstitutionRepositoryImpl(db)),
             document_repository=DocumentRepositoryImpl(db),
         )
         result = await use_case.execute(request_body.token)
-
-        return VerifyEntryQRResponse(
-            registration_id=result.registration_id,
-            participant_id=result.participant_id,
-            participant_name=result.participant_name,
-            participant_school=result.participant_school,
-            participant_grade=result.participant_grade,
-            competition_name=result.competition_name,
-            competition_id=result.competition_id,
-            can_proceed=result.can_proceed,
-            message=result.message,
-            institution_name=result.institution_name,
-            dob=result.dob,
-            has_documents=result.has_documents,
-        )
+        return _verify_response(result)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -84,6 +83,55 @@ async def verify_entry_qr(
         )
 
 
+@router.post("/verify_batch", response_model=VerifyEntryQRBatchResponse)
+async def verify_entry_qr_batch(
+    request_body: VerifyEntryQRBatchRequest,
+    current_user: Annotated[User, Depends(require_role(UserRole.ADMITTER, UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Verify several entry QR codes in one round trip.
+
+    Intended for scanners that queue codes while a line of participants
+    passes. Each token gets its own result or error in request order;
+    one bad token does not fail the batch. Tokens are NOT consumed.
+    """
+    use_case = VerifyEntryQRUseCase(
+        token_service=TokenService(settings.hmac_secret_key),
+        entry_token_repository=EntryTokenRepositoryImpl(db),
+        registration_repository=RegistrationRepositoryImpl(db),
+        participant_repository=ParticipantRepositoryImpl(db),
+        competition_repository=CachedCompetitionRepository(CompetitionRepositoryImpl(db)),
+        institution_repository=CachedInstitutionRepository(InstitutionRepositoryImpl(db)),
+        document_repository=DocumentRepositoryImpl(db),
+    )
+    items = await use_case.verify_batch(request_body.tokens)
+
+    return VerifyEntryQRBatchResponse(items=[
+        VerifyEntryQRBatchItemResponse(
+            result=_verify_response(item.result) if item.result else None,
+            error=item.error,
+        )
+        for item in items
+    ])
+
+
+def _verify_response(result: VerifyEntryQRResult) -> VerifyEntryQRResponse:
+    return VerifyEntryQRResponse(
+        registration_id=result.registration_id,
+        participant_id=result.participant_id,
+        participant_name=result.participant_name,
+        participant_school=result.participant_school,
+        participant_grade=result.participant_grade,
+        competition_name=result.competition_name,
+        competition_id=result.competition_id,
+        can_proceed=result.can_proceed,
+        message=result.message,
+        institution_name=result.institution_name,
+        dob=result.dob,
+        has_documents=result.has_documents,
+    )
+
+
 @router.post("/{registration_id}/approve", response_model=ApproveAdmissionResponse, status_code=status.HTTP_201_CREATED)
 async def approve_admission(
     registration_id: UUID,
@@ -102,15 +150,12 @@ async def approve_admission(
             token_service=TokenService(settings.hmac_secret_key),
             entry_token_repository=EntryTokenRepositoryImpl(db),
             registration_repository=RegistrationRepositoryImpl(db),
-            competition_repository=CompetitionRepositoryImpl(db),
+            competition_repository=CachedCompetitionRepository(CompetitionRepositoryImpl(db)),
             attempt_repository=AttemptRepositoryImpl(db),
             audit_log_repository=AuditLogRepositoryImpl(db),
             answer_sheet_repository=AnswerSheetRepositoryImpl(db),
-            storage=MinIOStorage(),
-            sheet_generator=SheetGenerator(),
             room_repository=RoomRepositoryImpl(db),
             seat_assignment_repository=SeatAssignmentRepositoryImpl(db),
-            participant_repository=ParticipantRepositoryImpl(db),
         )
         result = await use_case.execute(
             registration_id=registration_id,
@@ -118,21 +163,34 @@ async def approve_admission(
             admitter_user_id=current_user.id,
             ip_address=request.client.host if request.client else None,
         )
-
-        return ApproveAdmissionResponse(
-            attempt_id=result.attempt_id,
-            variant_number=result.variant_number,
-            pdf_url=result.pdf_url,
-            sheet_token=result.sheet_token,
-            room_name=result.room_name,
-            seat_number=result.seat_number,
-        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
+    # Render only once the attempt is committed, so a rollback leaves no
+    # orphaned PDF; the broker publish is blocking, keep it off the loop
+    await db.commit()
+    job = result.sheet_render
+    try:
+        await asyncio.to_thread(
+            render_answer_sheet.delay,
+            job.competition_name, job.variant_number, job.sheet_token, job.object_name,
+        )
+    except Exception:
+        # The admission stands; the download keeps answering 503
+        logger.exception("Failed to enqueue answer sheet %s", job.object_name)
+
+    return ApproveAdmissionResponse(
+        attempt_id=result.attempt_id,
+        variant_number=result.variant_number,
+        pdf_url=result.pdf_url,
+        sheet_token=result.sheet_token,
+        room_name=result.room_name,
+        seat_number=result.seat_number,
+    )
+
 
 @router.get("/sheets/{attempt_id}/download")
 async def download_answer_sheet(
@@ -157,8 +215,27 @@ async def download_answer_sheet(
                 detail="PDF файл не найден для этой попытки",
             )
 
-        storage = MinIOStorage()
-        pdf_bytes = storage.download_file(
+        # The MinIO SDK is blocking: keep its HTTP calls off the event loop
+        storage = await asyncio.to_thread(MinIOStorage)
+        # The PDF is rendered by a background worker right after admission
+        for delay in SHEET_WAIT_DELAYS:
+            if await asyncio.to_thread(
+                storage.file_exists, settings.minio_bucket_sheets, attempt.pdf_file_path
+            ):
+                break
+            await asyncio.sleep(delay)
+        else:
+            if not await asyncio.to_thread(
+                storage.file_exists, settings.minio_bucket_sheets, attempt.pdf_file_path
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="PDF ещё формируется, повторите попытку позже",
+                    headers={"Retry-After": "2"},
+                )
+
+        pdf_bytes = await asyncio.to_thread(
+            storage.download_file,
             bucket=settings.minio_bucket_sheets,
             object_name=attempt.pdf_file_path,
         )
@@ -170,6 +247,8 @@ async def download_answer_sheet(
                 "Content-Disposition": f"attachment; filename=answer_sheet_{attempt_id}.pdf"
             },
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
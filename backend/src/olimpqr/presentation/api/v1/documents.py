@@ -46,7 +46,6 @@ async def upload_document(
         )
 
     try:
-        file_data = await file.read()
         use_case = UploadDocumentUseCase(
             document_repository=DocumentRepositoryImpl(db),
             participant_repository=participant_repo,
@@ -54,7 +53,8 @@ async def upload_document(
         )
         result = await use_case.execute(
             participant_id=participant.id,
-            file_data=file_data,
+            # Starlette spools large uploads to disk; stream from there
+            file_data=file.file,
             file_type=file.content_type or "application/octet-stream",
             original_filename=file.filename or "document",
         )
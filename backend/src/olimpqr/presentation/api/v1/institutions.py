@@ -11,11 +11,14 @@ from ....domain.value_objects import UserRole
 from ....domain.entities import User
 from ....application.use_cases.institutions import (
     CreateInstitutionUseCase,
+    CreateInstitutionsBulkUseCase,
     ListInstitutionsUseCase,
     SearchInstitutionsUseCase,
 )
 from ...schemas.institution_schemas import (
     CreateInstitutionRequest,
+    CreateInstitutionsBulkRequest,
+    CreateInstitutionsBulkResponse,
     InstitutionResponse,
     InstitutionListResponse,
 )
@@ -90,6 +93,39 @@ async def create_institution(
         )
 
 
+@router.post("/bulk", response_model=CreateInstitutionsBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_institutions_bulk(
+    request_body: CreateInstitutionsBulkRequest,
+    current_user: Annotated[User, Depends(require_role(UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Import many institutions at once (admin only).
+
+    Names that already exist, or repeat exactly within the request, are
+    skipped and counted separately.
+    """
+    try:
+        use_case = CreateInstitutionsBulkUseCase(
+            institution_repository=InstitutionRepositoryImpl(db),
+        )
+        result = await use_case.execute([
+            (item.name, item.short_name, item.city) for item in request_body.institutions
+        ])
+        return CreateInstitutionsBulkResponse(
+            created=[
+                InstitutionResponse(id=r.id, name=r.name, short_name=r.short_name, city=r.city)
+                for r in result.created
+            ],
+            duplicates=result.duplicates,
+            existing=result.existing,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
 @router.delete("/{institution_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_institution(
     institution_id: UUID,
@@ -9,6 +9,7 @@ from ....infrastructure.database import get_db
 from ....infrastructure.repositories import (
     RegistrationRepositoryImpl,
     CompetitionRepositoryImpl,
+    CachedCompetitionRepository,
     ParticipantRepositoryImpl,
     EntryTokenRepositoryImpl,
     AttemptRepositoryImpl
@@ -16,10 +17,7 @@ from ....infrastructure.repositories import (
 from ....domain.services import TokenService, QRService
 from ....domain.value_objects import UserRole
 from ....domain.entities import User
-from ....application.use_cases.registration import (
-    RegisterForCompetitionUseCase,
-    GetEntryQRUseCase
-)
+from ....application.use_cases.registration import RegisterForCompetitionUseCase
 from ...schemas.registration_schemas import (
     RegisterForCompetitionRequest,
     RegistrationResponse,
@@ -55,8 +53,9 @@ async def register_for_competition(
 
         # Create repositories
         registration_repo = RegistrationRepositoryImpl(db)
-        competition_repo = CompetitionRepositoryImpl(db)
-        entry_token_repo = EntryTokenRepositoryImpl(db)
+        # Registration opens in a burst for one competition; serve its
+        # lookup from the shared cache instead of one SELECT per request
+        competition_repo = CachedCompetitionRepository(CompetitionRepositoryImpl(db))
         token_service = TokenService(settings.hmac_secret_key)
 
         # Create use case
@@ -64,7 +63,6 @@ async def register_for_competition(
             registration_repo,
             competition_repo,
             participant_repo,
-            entry_token_repo,
             token_service
         )
 
@@ -7,7 +7,12 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....infrastructure.database import get_db
-from ....infrastructure.repositories import RoomRepositoryImpl, CompetitionRepositoryImpl
+from ....infrastructure.repositories import (
+    RoomRepositoryImpl,
+    CompetitionRepositoryImpl,
+    RegistrationRepositoryImpl,
+    SeatAssignmentRepositoryImpl,
+)
 from ....domain.value_objects import UserRole
 from ....domain.entities import User
 from ....application.use_cases.rooms import (
@@ -15,10 +20,12 @@ from ....application.use_cases.rooms import (
     ListRoomsUseCase,
     DeleteRoomUseCase,
 )
+from ....application.use_cases.seating import AssignSeatUseCase
 from ...schemas.room_schemas import (
     CreateRoomRequest,
     RoomResponse,
     RoomListResponse,
+    AssignSeatsResponse,
 )
 from ...dependencies import require_role
 
@@ -92,3 +99,36 @@ async def delete_room(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Аудитория не найдена",
         )
+
+
+@router.post("/{competition_id}/assign-seats", response_model=AssignSeatsResponse)
+async def assign_seats(
+    competition_id: UUID,
+    current_user: Annotated[User, Depends(require_role(UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Seat every registration of a competition that has no seat yet (admin only)."""
+    competition = await CompetitionRepositoryImpl(db).get_by_id(competition_id)
+    if not competition:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Олимпиада не найдена",
+        )
+
+    use_case = AssignSeatUseCase(
+        room_repository=RoomRepositoryImpl(db),
+        seat_assignment_repository=SeatAssignmentRepositoryImpl(db),
+        registration_repository=RegistrationRepositoryImpl(db),
+    )
+    try:
+        results = await use_case.assign_all(
+            competition_id=competition_id,
+            variants_count=competition.variants_count,
+        )
+    except IntegrityError:
+        # Another assignment took the same seats after occupancy was read
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Рассадка изменилась во время распределения, повторите запрос",
+        )
+    return AssignSeatsResponse(assigned=len(results))
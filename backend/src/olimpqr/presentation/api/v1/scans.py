@@ -1,5 +1,6 @@
 """Scanner API endpoints."""
 
+import asyncio
 from typing import Annotated, Optional
 from uuid import UUID, uuid4
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
@@ -63,8 +64,10 @@ async def upload_scan(
     ext = file.filename.rsplit(".", 1)[-1] if file.filename and "." in file.filename else "png"
     object_name = f"scans/{scan_id}.{ext}"
 
-    storage = MinIOStorage()
-    storage.upload_file(
+    # The MinIO SDK is blocking: keep its HTTP calls off the event loop
+    storage = await asyncio.to_thread(MinIOStorage)
+    await asyncio.to_thread(
+        storage.upload_file,
         bucket=settings.minio_bucket_scans,
         object_name=object_name,
         data=file_data,
@@ -161,9 +164,10 @@ async def get_scan_image(
     if not scan:
         raise HTTPException(status_code=404, detail="Скан не найден")
 
-    storage = MinIOStorage()
+    storage = await asyncio.to_thread(MinIOStorage)
     try:
-        file_bytes = storage.download_file(
+        file_bytes = await asyncio.to_thread(
+            storage.download_file,
             bucket=settings.minio_bucket_scans,
             object_name=scan.file_path,
         )
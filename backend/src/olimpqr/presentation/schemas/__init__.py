@@ -20,6 +20,9 @@ from .registration_schemas import (
 from .admission_schemas import (
     VerifyEntryQRRequest,
     VerifyEntryQRResponse,
+    VerifyEntryQRBatchRequest,
+    VerifyEntryQRBatchItemResponse,
+    VerifyEntryQRBatchResponse,
     ApproveAdmissionRequest,
     ApproveAdmissionResponse,
 )
@@ -38,6 +41,9 @@ __all__ = [
     "EntryQRResponse",
     "VerifyEntryQRRequest",
     "VerifyEntryQRResponse",
+    "VerifyEntryQRBatchRequest",
+    "VerifyEntryQRBatchItemResponse",
+    "VerifyEntryQRBatchResponse",
     "ApproveAdmissionRequest",
     "ApproveAdmissionResponse",
 ]
@@ -44,6 +44,24 @@ class VerifyEntryQRResponse(BaseModel):
     }
 
 
+class VerifyEntryQRBatchRequest(BaseModel):
+    """Request to verify several entry QR codes at once."""
+    tokens: list[str] = Field(
+        ..., min_length=1, max_length=100, description="Raw tokens scanned from QR codes"
+    )
+
+
+class VerifyEntryQRBatchItemResponse(BaseModel):
+    """Verification outcome for one token of a batch."""
+    result: VerifyEntryQRResponse | None = None
+    error: str | None = None
+
+
+class VerifyEntryQRBatchResponse(BaseModel):
+    """Response after verifying a batch of entry QR codes, in request order."""
+    items: list[VerifyEntryQRBatchItemResponse]
+
+
 class ApproveAdmissionRequest(BaseModel):
     """Request to approve admission."""
     raw_entry_token: str = Field(..., description="Raw entry token for re-verification")
@@ -11,6 +11,11 @@ class CreateInstitutionRequest(BaseModel):
     city: str | None = Field(None, max_length=255)
 
 
+class CreateInstitutionsBulkRequest(BaseModel):
+    """Request to import many institutions at once."""
+    institutions: list[CreateInstitutionRequest] = Field(..., min_length=1, max_length=10000)
+
+
 class UpdateInstitutionRequest(BaseModel):
     """Request to update an institution."""
     name: str = Field(..., min_length=2, max_length=255)
@@ -30,3 +35,14 @@ class InstitutionListResponse(BaseModel):
     """List of institutions."""
     institutions: list[InstitutionResponse]
     total: int
+
+
+class CreateInstitutionsBulkResponse(BaseModel):
+    """Institutions created by a bulk import.
+
+    duplicates counts names repeated within the request, existing counts
+    names already in the database; both are skipped.
+    """
+    created: list[InstitutionResponse]
+    duplicates: int
+    existing: int
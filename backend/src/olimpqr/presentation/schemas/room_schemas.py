@@ -21,3 +21,8 @@ class RoomResponse(BaseModel):
 class RoomListResponse(BaseModel):
     """List of rooms."""
     rooms: list[RoomResponse]
+
+
+class AssignSeatsResponse(BaseModel):
+    """Result of seating all unseated registrations."""
+    assigned: int
@@ -220,16 +220,12 @@ class TestComprehensiveWorkflow:
         mock_storage.upload_file.return_value = "sheets/participant_123.pdf"
         mock_storage.get_presigned_url.return_value = "http://minio.test/sheets/participant_123.pdf"
 
-        mock_sheet_gen = MagicMock()
-        mock_sheet_gen.generate_answer_sheet.return_value = b"%PDF-1.4 mock answer sheet content"
-
         with patch(
             "olimpqr.presentation.api.v1.admission.MinIOStorage",
             return_value=mock_storage
         ), patch(
-            "olimpqr.presentation.api.v1.admission.SheetGenerator",
-            return_value=mock_sheet_gen
-        ):
+            "olimpqr.presentation.api.v1.admission.render_answer_sheet"
+        ) as mock_render:
             approve_resp = await client.post(
                 f"/api/v1/admission/{registration_id}/approve",
                 json={"raw_entry_token": entry_token_initial},
@@ -244,6 +240,10 @@ class TestComprehensiveWorkflow:
 
         assert 1 <= variant_number <= 4
         assert f"admission/sheets/{attempt_id}/download" in approve_data["pdf_url"]
+        # PDF rendering is handed off to the worker
+        mock_render.delay.assert_called_once()
+        assert mock_render.delay.call_args.args[1] == variant_number
+        assert mock_render.delay.call_args.args[3].endswith(f"{attempt_id}.pdf")
         assert sheet_token is not None
         assert len(sheet_token) > 20
 
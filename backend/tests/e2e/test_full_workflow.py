@@ -138,16 +138,12 @@ class TestFullCompetitionWorkflow:
         mock_storage.upload_file.return_value = "sheets/test.pdf"
         mock_storage.get_presigned_url.return_value = "http://mock-minio/sheets/test.pdf"
 
-        mock_sheet_gen = MagicMock()
-        mock_sheet_gen.generate_answer_sheet.return_value = b"%PDF-1.4 mock content"
-
         with patch(
             "olimpqr.presentation.api.v1.admission.MinIOStorage",
             return_value=mock_storage,
         ), patch(
-            "olimpqr.presentation.api.v1.admission.SheetGenerator",
-            return_value=mock_sheet_gen,
-        ):
+            "olimpqr.presentation.api.v1.admission.render_answer_sheet"
+        ) as render_task:
             approve_resp = await client.post(
                 f"/api/v1/admission/{registration_id}/approve",
                 json={"raw_entry_token": entry_token},
@@ -155,6 +151,9 @@ class TestFullCompetitionWorkflow:
             )
         assert approve_resp.status_code == 201, approve_resp.json()
         approve_data = approve_resp.json()
+        # Enqueued once, after commit, with the raw token the QR encodes
+        render_task.delay.assert_called_once()
+        assert approve_data["sheet_token"] in render_task.delay.call_args.args
         attempt_id = approve_data["attempt_id"]
         assert approve_data["variant_number"] >= 1
         assert "admission/sheets/" in approve_data["pdf_url"]
@@ -318,15 +317,12 @@ class TestFullCompetitionWorkflow:
         mock_storage = MagicMock()
         mock_storage.upload_file.return_value = "sheets/test.pdf"
         mock_storage.get_presigned_url.return_value = "http://mock-minio/sheets/test.pdf"
-        mock_sheet_gen = MagicMock()
-        mock_sheet_gen.generate_answer_sheet.return_value = b"%PDF-1.4 mock"
 
         with patch(
             "olimpqr.presentation.api.v1.admission.MinIOStorage",
             return_value=mock_storage,
         ), patch(
-            "olimpqr.presentation.api.v1.admission.SheetGenerator",
-            return_value=mock_sheet_gen,
+            "olimpqr.presentation.api.v1.admission.render_answer_sheet"
         ):
             first_approve = await client.post(
                 f"/api/v1/admission/{reg_id}/approve",
@@ -340,8 +336,7 @@ class TestFullCompetitionWorkflow:
             "olimpqr.presentation.api.v1.admission.MinIOStorage",
             return_value=mock_storage,
         ), patch(
-            "olimpqr.presentation.api.v1.admission.SheetGenerator",
-            return_value=mock_sheet_gen,
+            "olimpqr.presentation.api.v1.admission.render_answer_sheet"
         ):
             second_approve = await client.post(
                 f"/api/v1/admission/{reg_id}/approve",
@@ -180,3 +180,33 @@ class TestAuditLog:
         data = response.json()
         assert "items" in data
         assert "total" in data
+
+
+@pytest.mark.integration
+class TestAdminRegistration:
+    """Tests for POST /api/v1/admin/registrations."""
+
+    async def test_register_twice_rejected(self, client: AsyncClient, admin_user, participant_user):
+        """A second registration for the same competition is rejected."""
+        _, headers = admin_user
+        _, participant, _ = participant_user
+        resp = await client.post(
+            "/api/v1/competitions",
+            json={
+                "name": "Physics Olympiad",
+                "date": "2026-03-15",
+                "registration_start": "2026-02-01T00:00:00",
+                "registration_end": "2026-03-10T23:59:59",
+                "variants_count": 2,
+                "max_score": 50,
+            },
+            headers=headers,
+        )
+        body = {"participant_id": str(participant.id), "competition_id": resp.json()["id"]}
+
+        first = await client.post("/api/v1/admin/registrations", json=body, headers=headers)
+        assert first.status_code == 201
+
+        second = await client.post("/api/v1/admin/registrations", json=body, headers=headers)
+        assert second.status_code == 400
+        assert "уже зарегистрированы" in second.json()["detail"]
@@ -36,6 +36,40 @@ class TestInstitutionsAPI:
         )
         assert response.status_code == 400
 
+    async def test_create_institutions_bulk(self, client: AsyncClient, admin_user):
+        _, headers = admin_user
+        await client.post(
+            "/api/v1/institutions",
+            json={"name": "Existing School"},
+            headers=headers,
+        )
+        response = await client.post(
+            "/api/v1/institutions/bulk",
+            json={"institutions": [
+                {"name": "Bulk School A", "city": "Kazan"},
+                {"name": "Existing School"},
+                {"name": "Bulk School B"},
+                {"name": "Bulk School A"},
+                {"name": "bulk school b"},
+            ]},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert [i["name"] for i in data["created"]] == ["Bulk School A", "Bulk School B", "bulk school b"]
+        assert data["created"][0]["city"] == "Kazan"
+        assert data["duplicates"] == 1
+        assert data["existing"] == 1
+
+    async def test_create_institutions_bulk_rejects_blank_name(self, client: AsyncClient, admin_user):
+        _, headers = admin_user
+        response = await client.post(
+            "/api/v1/institutions/bulk",
+            json={"institutions": [{"name": "Valid School"}, {"name": " a"}]},
+            headers=headers,
+        )
+        assert response.status_code == 400
+
     async def test_list_institutions(self, client: AsyncClient, admin_user):
         _, headers = admin_user
         await client.post("/api/v1/institutions", json={"name": "A School"}, headers=headers)
@@ -5,10 +5,19 @@ import pytest_asyncio
 from uuid import uuid4
 from datetime import datetime, timedelta
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .conftest import make_auth_header, CompetitionModel
 from olimpqr.domain.value_objects import UserRole, CompetitionStatus
+from olimpqr.infrastructure.database.models import (
+    InstitutionModel,
+    ParticipantModel,
+    RegistrationModel,
+    SeatAssignmentModel,
+    UserModel,
+)
+from olimpqr.infrastructure.repositories import SeatAssignmentRepositoryImpl
 
 
 @pytest.mark.asyncio
@@ -64,3 +73,75 @@ class TestRoomsAPI:
 
         response = await client.delete(f"/api/v1/rooms/room/{room_id}", headers=headers)
         assert response.status_code == 204
+
+    async def test_assign_seats(self, client: AsyncClient, admin_user, db_session):
+        user, headers = admin_user
+        comp = await self._create_competition(db_session, user.id)
+        await client.post(f"/api/v1/rooms/{comp.id}", json={"name": "R1", "capacity": 2}, headers=headers)
+        await client.post(f"/api/v1/rooms/{comp.id}", json={"name": "R2", "capacity": 2}, headers=headers)
+
+        inst = InstitutionModel(id=uuid4(), name="Lyceum 1")
+        db_session.add(inst)
+        for i in range(5):
+            user_id, participant_id = uuid4(), uuid4()
+            db_session.add(UserModel(
+                id=user_id, email=f"seat{i}@test.com", password_hash="x",
+                role=UserRole.PARTICIPANT, is_active=True,
+            ))
+            db_session.add(ParticipantModel(
+                id=participant_id, user_id=user_id, full_name=f"Participant {i}",
+                school="School", grade=10, institution_id=inst.id if i < 2 else None,
+            ))
+            db_session.add(RegistrationModel(
+                id=uuid4(), participant_id=participant_id, competition_id=comp.id,
+                created_at=datetime.utcnow() + timedelta(seconds=i),
+            ))
+        await db_session.commit()
+
+        response = await client.post(f"/api/v1/rooms/{comp.id}/assign-seats", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["assigned"] == 4  # two rooms of two seats
+
+        seats = (await db_session.execute(
+            select(SeatAssignmentModel.room_id, SeatAssignmentModel.seat_number)
+            .join(RegistrationModel, SeatAssignmentModel.registration_id == RegistrationModel.id)
+            .order_by(RegistrationModel.created_at)
+        )).all()
+        assert sorted(seat for _, seat in seats) == [1, 1, 2, 2]
+        # The first two registrations share an institution and get split up
+        assert seats[0].room_id != seats[1].room_id
+
+        response = await client.post(f"/api/v1/rooms/{comp.id}/assign-seats", headers=headers)
+        assert response.json()["assigned"] == 0
+
+    async def test_assign_seats_conflict(self, client: AsyncClient, admin_user, db_session, monkeypatch):
+        user, headers = admin_user
+        comp = await self._create_competition(db_session, user.id)
+        await client.post(f"/api/v1/rooms/{comp.id}", json={"name": "R1", "capacity": 2}, headers=headers)
+
+        for i in range(2):
+            user_id, participant_id = uuid4(), uuid4()
+            db_session.add(UserModel(
+                id=user_id, email=f"race{i}@test.com", password_hash="x",
+                role=UserRole.PARTICIPANT, is_active=True,
+            ))
+            db_session.add(ParticipantModel(
+                id=participant_id, user_id=user_id, full_name=f"Participant {i}",
+                school="School", grade=10,
+            ))
+            db_session.add(RegistrationModel(
+                id=uuid4(), participant_id=participant_id, competition_id=comp.id,
+                created_at=datetime.utcnow() + timedelta(seconds=i),
+            ))
+            await db_session.commit()
+            if i == 0:
+                response = await client.post(f"/api/v1/rooms/{comp.id}/assign-seats", headers=headers)
+                assert response.json()["assigned"] == 1
+
+        # A concurrent run read occupancy before the first seat was taken
+        async def stale_occupancy(self, competition_id):
+            return []
+
+        monkeypatch.setattr(SeatAssignmentRepositoryImpl, "get_occupancy", stale_occupancy)
+        response = await client.post(f"/api/v1/rooms/{comp.id}/assign-seats", headers=headers)
+        assert response.status_code == 409
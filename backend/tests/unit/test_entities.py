@@ -78,6 +78,15 @@ class TestCompetition:
                 registration_end=datetime.utcnow(),
             )
 
+    def test_validate_only_changed_fields(self):
+        c = self._make()
+        c.max_score = 0
+        c.validate({"name"})  # max_score is not re-checked
+        with pytest.raises(ValueError):
+            c.validate({"max_score"})
+        with pytest.raises(ValueError):
+            c.validate()
+
 
 # --- Registration ---
 
@@ -142,6 +151,11 @@ class TestEntryToken:
         assert et.is_expired is True
         assert et.is_valid is False
 
+    def test_expired_at_given_moment(self):
+        et = EntryToken.create(token_hash=self._hash(), registration_id=uuid4(), expire_hours=1)
+        assert et.is_expired_at(et.expires_at) is False
+        assert et.is_expired_at(et.expires_at + timedelta(seconds=1)) is True
+
     def test_cannot_use_expired(self):
         et = EntryToken(
             token_hash=self._hash(),
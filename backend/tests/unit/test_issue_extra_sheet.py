@@ -0,0 +1,64 @@
+"""Unit tests for issuing extra answer sheets."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from olimpqr.domain.entities import Attempt
+from olimpqr.domain.services import TokenService
+from olimpqr.domain.value_objects import TokenHash
+from olimpqr.application.use_cases.invigilator.issue_extra_sheet import IssueExtraSheetUseCase
+
+
+@pytest.mark.asyncio
+class TestIssueExtraSheet:
+    def _make(self, storage, answer_sheet_repo):
+        attempt = Attempt(
+            registration_id=uuid4(),
+            variant_number=1,
+            sheet_token_hash=TokenHash(value="b" * 64),
+        )
+        attempt_repo = AsyncMock()
+        attempt_repo.get_by_id.return_value = attempt
+        uc = IssueExtraSheetUseCase(
+            answer_sheet_repository=answer_sheet_repo,
+            attempt_repository=attempt_repo,
+            token_service=TokenService("x" * 40),
+            sheet_generator=MagicMock(),
+            storage=storage,
+        )
+        return uc, attempt
+
+    async def test_failed_upload_waits_for_insert(self):
+        storage = MagicMock()
+        storage.upload_file.side_effect = RuntimeError("minio down")
+        insert_done = []
+
+        async def slow_create(entity):
+            await asyncio.sleep(0.05)
+            insert_done.append(entity)
+            return entity
+
+        answer_sheet_repo = AsyncMock()
+        answer_sheet_repo.create.side_effect = slow_create
+        uc, attempt = self._make(storage, answer_sheet_repo)
+
+        with pytest.raises(RuntimeError, match="minio down"):
+            await uc.execute(attempt.id)
+        # The flush settled before the error reached the caller
+        assert insert_done
+        storage.delete_file.assert_not_called()
+
+    async def test_failed_insert_deletes_uploaded_pdf(self):
+        storage = MagicMock()
+        answer_sheet_repo = AsyncMock()
+        answer_sheet_repo.create.side_effect = ValueError("insert failed")
+        uc, attempt = self._make(storage, answer_sheet_repo)
+
+        with pytest.raises(ValueError, match="insert failed"):
+            await uc.execute(attempt.id)
+        object_name = storage.upload_file.call_args.kwargs["object_name"]
+        storage.delete_file.assert_called_once()
+        assert storage.delete_file.call_args.args[1] == object_name
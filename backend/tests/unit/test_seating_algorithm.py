@@ -41,19 +41,18 @@ class TestSeatingAlgorithm:
         room_repo.get_by_id.return_value = room2
 
         seat_repo = AsyncMock()
-        seat_repo.get_by_registration.return_value = None
-        seat_repo.count_by_room.side_effect = [5, 5]  # both have 5 occupied
-        seat_repo.count_by_room_and_institution.side_effect = [3, 1]  # room1 has 3 same inst, room2 has 1
-        seat_repo.get_by_room.return_value = []
+        seat_repo.get_with_room_name.return_value = None
+        seat_repo.get_room_stats.return_value = {
+            room1.id: (5, 3),  # 5 occupied, 3 from the same institution
+            room2.id: (5, 1),
+        }
+        seat_repo.next_free_seat.return_value = 1
         seat_repo.create.return_value = None
 
         reg_repo = AsyncMock()
-        reg_repo.get_by_id.return_value = registration
+        reg_repo.get_with_institution.return_value = (registration, participant.institution_id)
 
-        part_repo = AsyncMock()
-        part_repo.get_by_id.return_value = participant
-
-        uc = AssignSeatUseCase(room_repo, seat_repo, reg_repo, part_repo)
+        uc = AssignSeatUseCase(room_repo, seat_repo, reg_repo)
         result = await uc.execute(registration.id, uuid4(), variants_count=4)
 
         assert result is not None
@@ -66,19 +65,16 @@ class TestSeatingAlgorithm:
         )
 
         room_repo = AsyncMock()
-        room_repo.get_by_id.return_value = Room(
-            id=existing.room_id, competition_id=uuid4(), name="R1", capacity=30
-        )
 
         seat_repo = AsyncMock()
-        seat_repo.get_by_registration.return_value = existing
+        seat_repo.get_with_room_name.return_value = (existing, "R1")
 
         reg_repo = AsyncMock()
-        part_repo = AsyncMock()
 
-        uc = AssignSeatUseCase(room_repo, seat_repo, reg_repo, part_repo)
+        uc = AssignSeatUseCase(room_repo, seat_repo, reg_repo)
         result = await uc.execute(existing.registration_id, uuid4(), variants_count=4)
 
+        assert result.room_name == "R1"
         assert result.seat_number == 3
         assert result.variant_number == 2
 
@@ -90,15 +86,12 @@ class TestSeatingAlgorithm:
         room_repo.get_by_competition.return_value = []
 
         seat_repo = AsyncMock()
-        seat_repo.get_by_registration.return_value = None
+        seat_repo.get_with_room_name.return_value = None
 
         reg_repo = AsyncMock()
-        reg_repo.get_by_id.return_value = registration
+        reg_repo.get_with_institution.return_value = (registration, participant.institution_id)
 
-        part_repo = AsyncMock()
-        part_repo.get_by_id.return_value = participant
-
-        uc = AssignSeatUseCase(room_repo, seat_repo, reg_repo, part_repo)
+        uc = AssignSeatUseCase(room_repo, seat_repo, reg_repo)
         result = await uc.execute(registration.id, uuid4(), variants_count=4)
 
         assert result is None
@@ -114,19 +107,15 @@ class TestSeatingAlgorithm:
         room_repo.get_by_id.return_value = room
 
         seat_repo = AsyncMock()
-        seat_repo.get_by_registration.return_value = None
-        seat_repo.count_by_room.return_value = 0
-        seat_repo.count_by_room_and_institution.return_value = 0
-        seat_repo.get_by_room.return_value = []
+        seat_repo.get_with_room_name.return_value = None
+        seat_repo.get_room_stats.return_value = {}
+        seat_repo.next_free_seat.return_value = 1
         seat_repo.create.return_value = None
 
         reg_repo = AsyncMock()
-        reg_repo.get_by_id.return_value = registration
-
-        part_repo = AsyncMock()
-        part_repo.get_by_id.return_value = participant
+        reg_repo.get_with_institution.return_value = (registration, participant.institution_id)
 
-        uc = AssignSeatUseCase(room_repo, seat_repo, reg_repo, part_repo)
+        uc = AssignSeatUseCase(room_repo, seat_repo, reg_repo)
         result = await uc.execute(registration.id, uuid4(), variants_count=4)
 
         assert result is not None
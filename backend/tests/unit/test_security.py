@@ -1,7 +1,7 @@
 """Unit tests for security utilities."""
 
 import pytest
-from olimpqr.infrastructure.security import hash_password, verify_password
+from olimpqr.infrastructure.security import hash_password, verify_password, dummy_password_hash
 
 
 class TestPasswordHashing:
@@ -30,3 +30,9 @@ class TestPasswordHashing:
         h1 = hash_password("same")
         h2 = hash_password("same")
         assert h1 != h2  # bcrypt uses random salt
+
+    def test_dummy_hash_uses_configured_cost(self):
+        # Same cost as real hashes, so unknown-email logins take as long
+        assert dummy_password_hash().split("$")[2] == hash_password("x").split("$")[2]
+        assert verify_password("testpassword", dummy_password_hash()) is False
+        assert dummy_password_hash() is dummy_password_hash()  # computed once
@@ -61,6 +61,16 @@ class TestTokenService:
 
         assert hash1.value == hash2.value
 
+    def test_hash_tokens_matches_hash_token(self, token_service):
+        """Test that bulk hashing gives the same hashes, in order."""
+        raw_tokens = ["token-a", "token-b", "token-a"]
+
+        hashes = token_service.hash_tokens(raw_tokens)
+
+        assert [h.value for h in hashes] == [
+            token_service.hash_token(raw).value for raw in raw_tokens
+        ]
+
     def test_different_secret_keys_produce_different_hashes(self):
         """Test that different secret keys produce different hashes."""
         raw_token = "test-token-value"
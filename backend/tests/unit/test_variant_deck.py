@@ -0,0 +1,36 @@
+"""Unit tests for fallback variant dealing."""
+
+from collections import Counter
+from uuid import uuid4
+
+from olimpqr.application.use_cases.admission.approve_admission import VariantDeck
+
+
+class TestVariantDeck:
+    def test_deals_each_variant_once_per_round(self):
+        deck = VariantDeck()
+        competition_id = uuid4()
+
+        dealt = [deck.deal(competition_id, 4) for _ in range(12)]
+
+        assert Counter(dealt) == {1: 3, 2: 3, 3: 3, 4: 3}
+        for start in range(0, 12, 4):
+            assert sorted(dealt[start:start + 4]) == [1, 2, 3, 4]
+
+    def test_competitions_have_separate_decks(self):
+        deck = VariantDeck()
+        first, second = uuid4(), uuid4()
+
+        deck.deal(first, 3)
+        dealt = [deck.deal(second, 3) for _ in range(3)]
+
+        assert sorted(dealt) == [1, 2, 3]
+
+    def test_reshuffles_when_variants_count_shrinks(self):
+        deck = VariantDeck()
+        competition_id = uuid4()
+        deck.deal(competition_id, 5)
+
+        dealt = [deck.deal(competition_id, 2) for _ in range(4)]
+
+        assert all(1 <= variant <= 2 for variant in dealt)
@@ -8,6 +8,24 @@ import Button from '../../components/common/Button';
 import Spinner from '../../components/common/Spinner';
 import FileUploader from '../../components/upload/FileUploader';
 
+// The sheet PDF is rendered by a background worker: until it is ready the
+// download answers 503 with Retry-After, so keep asking for a while
+const SHEET_DOWNLOAD_ATTEMPTS = 5;
+
+async function getSheetPdf(url: string) {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await api.get(url, { responseType: 'blob' });
+    } catch (err: unknown) {
+      const response = (err as { response?: { status?: number; headers?: Record<string, string> } })
+        ?.response;
+      if (response?.status !== 503 || attempt >= SHEET_DOWNLOAD_ATTEMPTS) throw err;
+      const seconds = Number(response.headers?.['retry-after']) || 2;
+      await new Promise((resolve) => setTimeout(resolve, seconds * 1000));
+    }
+  }
+}
+
 interface DocumentInfo {
   id: string;
   file_path: string;
@@ -189,9 +207,7 @@ const AdmissionPage: React.FC = () => {
     setError(null);
 
     try {
-      const response = await api.get(approveData.pdf_url, {
-        responseType: 'blob',
-      });
+      const response = await getSheetPdf(approveData.pdf_url);
 
       const blob = new Blob([response.data], { type: 'application/pdf' });
       const url = window.URL.createObjectURL(blob);